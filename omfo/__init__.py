@@ -0,0 +1,5 @@
+"""Shared data and computation layer for the OMFO Streamlit pages.
+
+Nothing in this package imports Streamlit, so the same code can be reused
+by command-line tools and benchmarks.
+"""
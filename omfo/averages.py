@@ -0,0 +1,120 @@
+"""Positional baselines for the radar charts.
+
+The "average of everyone else at this position" line used to be a filter
+and a fresh ``mean()`` over the whole position group for every player. Here
+each position's column sums and counts are kept once, and leaving a player
+out is the correction ``(sum - x) / (n - 1)``.
+
+The correction isn't bit-for-bit the filtered mean. Where that matters (an
+average within rounding of a league value, so the percentile lookup could
+land on the other side of the tie) the filtered mean is computed as before.
+"""
+import numpy as np
+import pandas as pd
+
+from omfo.data import SEASON_FILE, derived
+from omfo.metrics import season_metrics
+from omfo.percentiles import RADAR_COLUMNS
+
+# Relative distance to a league value below which an average is recomputed exactly
+TIE_TOLERANCE = 1e-9
+
+
+class PositionalAverages:
+    """Leave-one-out positional averages.
+
+    As on the pages, "one" is every row at the position with the player's
+    name (``name`` column, if ``df`` has it).
+    """
+
+    def __init__(self, df, columns=RADAR_COLUMNS, by='Pos.', name='Player'):
+        self.columns = list(columns)
+        self.by = by
+        self._df = df
+        self._index = df.index
+        self._codes, self.positions = pd.factorize(df[by])
+        values = df[self.columns].to_numpy(dtype='float64')
+        self._present = ~np.isnan(values)
+        self._values = np.where(self._present, values, 0.0)
+        # League values, for spotting averages that sit on a tie
+        self._sorted = np.sort(values, axis=0)
+
+        # NaN-skipping sums and counts per position, like DataFrame.mean()
+        n_pos = len(self.positions)
+        self.sums = np.zeros((n_pos, len(self.columns)))
+        self.counts = np.zeros((n_pos, len(self.columns)))
+        self._abs_sums = np.zeros((n_pos, len(self.columns)))
+        np.add.at(self.sums, self._codes, self._values)
+        np.add.at(self.counts, self._codes, self._present)
+        np.add.at(self._abs_sums, self._codes, np.abs(self._values))
+
+        # The rows each row leaves out: itself and any namesake at its position
+        if name in df.columns:
+            self._names = df[name].to_numpy()
+            self._groups, _ = pd.factorize(pd.MultiIndex.from_arrays([self._codes, self._names]))
+        else:
+            self._names = None
+            self._groups = np.arange(len(df))
+        n_groups = self._groups.max() + 1 if len(df) else 0
+        self._out_sums = np.zeros((n_groups, len(self.columns)))
+        self._out_counts = np.zeros((n_groups, len(self.columns)))
+        np.add.at(self._out_sums, self._groups, self._values)
+        np.add.at(self._out_counts, self._groups, self._present)
+
+    def _position_code(self, position):
+        return self.positions.get_loc(position)
+
+    def position_mean(self, position):
+        """Average stat line of every player at ``position``."""
+        code = self._position_code(position)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(self.sums[code] / self.counts[code], index=self.columns)
+
+    def _corrected(self, rows):
+        """``(means, near-tie mask)`` of the sum correction for an array of row positions."""
+        codes, groups = self._codes[rows], self._groups[rows]
+        remaining = self.counts[codes] - self._out_counts[groups]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = (self.sums[codes] - self._out_sums[groups]) / remaining
+            scale = np.maximum(np.abs(mean), self._abs_sums[codes] / remaining)
+        tol = TIE_TOLERANCE * scale
+        near = np.zeros(mean.shape, dtype=bool)
+        for j in range(len(self.columns)):
+            col = self._sorted[:, j]
+            at = np.searchsorted(col, mean[:, j] - tol[:, j])
+            near[:, j] = col[np.minimum(at, len(col) - 1)] <= mean[:, j] + tol[:, j]
+            near[at >= len(col), j] = False
+        return mean, near
+
+    def _filtered_mean(self, i):
+        # What the pages computed: filter the position, drop the player, mean()
+        keep = self._codes == self._codes[i]
+        if self._names is None:
+            keep[i] = False
+        else:
+            keep &= self._names != self._names[i]
+        return self._df.loc[keep, self.columns].mean().to_numpy(dtype='float64')
+
+    def excluding(self, label):
+        """Average of the other players at the position of the row labelled ``label``."""
+        i = self._index.get_loc(label)
+        mean, near = self._corrected(np.array([i]))
+        mean = mean[0]
+        if near.any():
+            mean = self._filtered_mean(i)
+        return pd.Series(mean, index=self.columns)
+
+    def leave_one_out(self):
+        """``excluding`` for every row at once, as a frame aligned with the source."""
+        mean, near = self._corrected(np.arange(len(self._index)))
+        for i in np.flatnonzero(near.any(axis=1)):
+            mean[i] = self._filtered_mean(i)
+        return pd.DataFrame(mean, index=self._index, columns=self.columns)
+
+
+def positional_averages(columns=RADAR_COLUMNS, path=SEASON_FILE):
+    """``PositionalAverages`` for the season file, built once per file version."""
+    columns = tuple(columns)
+    def build(df):
+        return PositionalAverages(season_metrics(['Player', 'Pos.', *columns], path), columns)
+    return derived(('positional_averages', columns), build, path)
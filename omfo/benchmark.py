@@ -0,0 +1,156 @@
+"""Scaling benchmarks for the computations behind the pages.
+
+Every case runs on synthetic leagues (``omfo.synthetic``) of each requested
+size and is timed over a few repeats. Results are written as JSON so runs
+from two versions can be compared::
+
+    python -m omfo.benchmark --out bench.json
+    python -m omfo.benchmark --sizes 128 10000 --out new.json --baseline bench.json
+
+Case inputs are prepared outside the timed region. For example, grading is
+timed on a table that already has its metrics, and a size's first repeat
+warms the radar template pool.
+"""
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from omfo.averages import PositionalAverages
+from omfo.data import prepare_season
+from omfo.grades import helio_grades
+from omfo.matchups import FUNNEL_STATS, FUNNEL_TOP_N, MatchupMatrix, funnel_stats
+from omfo.metrics import add_derived_metrics
+from omfo.percentiles import RADAR_COLUMNS, PercentileIndex
+from omfo.radar import RadarRenderer
+from omfo.rankings import top_k_per_group
+from omfo.synthetic import synthetic_league
+from omfo.teams import team_context
+
+DEFAULT_SIZES = [128, 1000, 10000, 100000]
+DEFAULT_REPEATS = 5
+# Slower than the baseline by more than this factor counts as a regression
+REGRESSION_RATIO = 1.25
+
+
+def _cases(raw, renderer):
+    """``{case name: zero-argument callable}`` over one synthetic league."""
+    league = add_derived_metrics(raw)
+    season = prepare_season(league)
+    funnel = funnel_stats(season)
+    teams = season['Team'].cat.categories[:2]
+    index = PercentileIndex(league, RADAR_COLUMNS)
+    averages = PositionalAverages(league, RADAR_COLUMNS)
+    label = league.index[0]
+    position = league.loc[label, 'Pos.']
+
+    def radar():
+        ranks = index.player(label)
+        avg = index.lookup(averages.excluding(label))
+        return renderer.player_vs_average(ranks, avg, league.loc[label, 'Player'], position, RADAR_COLUMNS)
+
+    return {
+        'derived_metrics': lambda: add_derived_metrics(raw),
+        'helio_grades': lambda: helio_grades(league),
+        'percentile_index': lambda: PercentileIndex(league, RADAR_COLUMNS),
+        'team_totals': lambda: team_context(season),
+        'funnel_pair': lambda: top_k_per_group(funnel[funnel['Team'].isin(teams)], ['Pos.'], FUNNEL_STATS,
+                                               FUNNEL_TOP_N, carry=['Player', 'Team']),
+        'funnel_matrix': lambda: MatchupMatrix(season, FUNNEL_STATS, FUNNEL_TOP_N),
+        'radar_render': radar,
+    }
+
+
+def time_case(func, repeats):
+    """Wall-clock seconds of each of ``repeats`` calls (after one warm-up call)."""
+    func()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run(sizes=DEFAULT_SIZES, repeats=DEFAULT_REPEATS, cases=None, seed=0, progress=None):
+    """Benchmark results as a JSON-ready dict."""
+    import matplotlib
+    import pandas as pd
+
+    results = []
+    renderer = RadarRenderer()
+    for size in sizes:
+        raw = synthetic_league(size, seed=seed)
+        for name, func in _cases(raw, renderer).items():
+            if cases and name not in cases:
+                continue
+            times = time_case(func, repeats)
+            results.append({
+                'case': name,
+                'size': size,
+                'repeats': repeats,
+                'min_s': min(times),
+                'median_s': statistics.median(times),
+                'mean_s': statistics.fmean(times),
+            })
+            if progress:
+                progress(results[-1])
+    return {
+        'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'versions': {'pandas': pd.__version__, 'numpy': np.__version__, 'matplotlib': matplotlib.__version__},
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare(current, baseline, ratio=REGRESSION_RATIO):
+    """``(case, size, baseline median, current median, ratio)`` for every case both runs timed."""
+    before = {(r['case'], r['size']): r['median_s'] for r in baseline['results']}
+    rows = []
+    for r in current['results']:
+        key = (r['case'], r['size'])
+        if key in before and before[key] > 0:
+            rows.append((*key, before[key], r['median_s'], r['median_s'] / before[key]))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the page computations on synthetic leagues.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='player rows per league')
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--cases', nargs='+', help='only these cases')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', help='write the results as JSON')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args(argv)
+
+    def progress(r):
+        print(f"{r['case']:<18} {r['size']:>7}  median {r['median_s'] * 1000:9.2f} ms  min {r['min_s'] * 1000:9.2f} ms",
+              flush=True)
+
+    report = run(args.sizes, args.repeats, args.cases, args.seed, progress)
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = 0
+        print(f"\n{'case':<18} {'size':>7} {'before ms':>10} {'after ms':>10} {'ratio':>6}")
+        for case, size, before, after, ratio in compare(report, baseline):
+            flag = '  REGRESSION' if ratio > REGRESSION_RATIO else ''
+            regressions += bool(flag)
+            print(f'{case:<18} {size:>7} {before * 1000:10.2f} {after * 1000:10.2f} {ratio:6.2f}{flag}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""Process-wide cache of rendered chart images.
+
+Rendered PNG bytes are kept under a byte budget and evicted least recently
+used first. The cache lives at module level, so every Streamlit session in
+the server process shares it and a popular comparison is only drawn once
+per data version.
+"""
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ChartCache:
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            if len(data) > self.max_bytes:
+                return
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += len(data)
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key, render):
+        """Cached bytes for ``key``, calling ``render()`` to produce them on a miss.
+
+        Rendering happens outside the lock, so two sessions missing the same
+        key at once may both draw it; the second result simply replaces the first.
+        """
+        data = self.get(key)
+        if data is None:
+            data = render()
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def stats(self):
+        return {'entries': len(self._items), 'bytes': self.size, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+_chart_cache = ChartCache()
+
+
+def chart_cache():
+    """The cache shared by every session in this process."""
+    return _chart_cache
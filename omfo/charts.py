@@ -0,0 +1,113 @@
+"""The chart images the pages show, rendered once per data version.
+
+Each function returns PNG bytes from the process-wide chart cache. The key
+includes the season file's content hash, so a Value Finder radar or a Team
+Matchups funnel is drawn once and then shared by every session until the
+data changes. The server warm-up (``omfo.warmup``) calls these same
+functions, so what it pre-renders is exactly what the pages look up.
+``fmt`` selects another matplotlib output format, such as ``'pdf'`` for the
+batch reports in ``omfo.scouting``.
+"""
+import io
+
+from omfo.averages import positional_averages
+from omfo.chart_cache import chart_cache
+from omfo.data import SEASON_FILE, season_cache
+from omfo.matchups import matchup_matrix
+from omfo.metrics import season_metrics
+from omfo.percentiles import RADAR_COLUMNS, percentile_index
+from omfo.profiling import timed
+from omfo.radar import RADAR_STYLE, SAVEFIG_OPTIONS, cached_radar, radar_renderer, render_lock
+
+# Funnel rows from top to bottom
+FUNNEL_POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+# Players in a row alternate between these
+FUNNEL_COLORS = ['red', 'black']
+
+
+def _player_label(position, player_name, path):
+    """Row label of the first player called ``player_name`` at ``position``."""
+    players = season_metrics(['Player', 'Pos.'], path)
+    at_position = players[players['Pos.'] == position]
+    return at_position.index[at_position['Player'] == player_name][0]
+
+
+def player_vs_average(position, player_name, columns=RADAR_COLUMNS, style=RADAR_STYLE, path=SEASON_FILE, fmt='png',
+                      label=None):
+    """Radar of a player against the average of the other players at ``position``.
+
+    ``label`` picks the season row when two players at ``position`` share a
+    name; by default it is the first one, as on the pages.
+    """
+    columns = list(columns)
+    index = percentile_index(columns, path)
+
+    def build(style):
+        # The average of the rest of the position comes from the precomputed positional sums
+        row = _player_label(position, player_name, path) if label is None else label
+        avg = positional_averages(columns, path).excluding(row)
+        return radar_renderer().player_vs_average(index.player(row), index.lookup(avg), player_name, position,
+                                                  columns, style, fmt)
+
+    key = (season_cache(path).version, 'player_vs_average', position, player_name, tuple(columns), fmt, label)
+    return cached_radar(key, build, style)
+
+
+def side_by_side(position, player_name1, player_name2, columns=RADAR_COLUMNS, style=RADAR_STYLE, path=SEASON_FILE,
+                 fmt='png'):
+    """Two players' radars next to each other."""
+    columns = list(columns)
+    index = percentile_index(columns, path)
+
+    def build(style):
+        ranks1 = index.player(_player_label(position, player_name1, path))
+        ranks2 = index.player(_player_label(position, player_name2, path))
+        return radar_renderer().side_by_side(ranks1, player_name1, ranks2, player_name2, columns, style, fmt)
+
+    key = (season_cache(path).version, 'side_by_side', position, player_name1, player_name2, tuple(columns), fmt)
+    return cached_radar(key, build, style)
+
+
+@timed('figure render')
+def render_funnel(top_players, team1, team2, stat, fmt='png'):
+    """Image of the centred, stacked bar funnel of ``MatchupMatrix.matchup`` rows."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    with render_lock:
+        fig = Figure(figsize=(12, 7))
+        FigureCanvasAgg(fig)
+        ax = fig.subplots()
+
+        # Widest position sets the scale; every row is centred on it
+        max_width = top_players.groupby('Pos.', observed=True)[stat].sum().max()
+        for i, position in enumerate(FUNNEL_POSITIONS):
+            position_data = top_players[top_players['Pos.'] == position]
+            start = (max_width - position_data[stat].sum()) / 2
+            for j, (player, value) in enumerate(zip(position_data['Player'], position_data[stat])):
+                color = FUNNEL_COLORS[j % 2]
+                ax.barh(i, value, left=start, color=color, edgecolor='white')
+                start += value
+                text_color = 'white' if color == 'black' else 'black'
+                ax.text(start - value / 2, i, f"{player} ({value:.1f})", ha='center', va='center', color=text_color,
+                        fontsize=10)
+
+        ax.set_yticks(range(len(FUNNEL_POSITIONS)))
+        ax.set_yticklabels(FUNNEL_POSITIONS)
+        ax.set_title(f' {team1} vs. {team2} {stat} matchup comparison')
+        # Centre at the top, no x axis
+        ax.invert_yaxis()
+        ax.xaxis.set_visible(False)
+        fig.tight_layout()
+
+        buf = io.BytesIO()
+        fig.savefig(buf, **{**SAVEFIG_OPTIONS, 'format': fmt})
+    return buf.getvalue()
+
+
+def funnel(team1, team2, stat, path=SEASON_FILE, fmt='png'):
+    """Team Matchups funnel: top two per position across both rosters for ``stat``."""
+    matrix = matchup_matrix(path)
+    key = (season_cache(path).version, 'funnel', team1, team2, stat, fmt)
+    return chart_cache().get_or_render(key, lambda: render_funnel(matrix.matchup(team1, team2, stat), team1, team2,
+                                                                  stat, fmt))
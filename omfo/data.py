@@ -0,0 +1,288 @@
+"""Shared access to the season stats table.
+
+The season file is loaded once per process and every caller gets a
+read-only view of the cached frame, so Streamlit reruns (and concurrent
+sessions) no longer pay for a CSV parse and cleanup each time a widget
+changes. Loading goes through the columnar snapshot (see ``omfo.snapshot``),
+so the derived metrics come precomputed. The cleaned table is attached from
+the memory-mapped files every server process shares (see ``omfo.shared``)
+rather than rebuilt per process.
+"""
+import contextlib
+import contextvars
+import hashlib
+import os
+import threading
+import zipfile
+
+import pandas as pd
+
+from omfo.schema import apply_schema
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+SEASON_FILE = os.path.join(DATA_DIR, '2023stats.csv')
+
+PERCENTAGE_COLUMNS = ['FG%', 'FG3%', 'FT%']
+
+
+def read_season_csv(path):
+    # Numbers exports are zip archives whatever their extension; read them natively
+    if zipfile.is_zipfile(path):
+        from omfo.numbers import read_numbers_table
+        raw = read_numbers_table(path)
+    else:
+        # The first line of a daily report is its name and date, the header is on the second
+        raw = pd.read_csv(path, skiprows=1)
+    return apply_schema(raw, path)
+
+
+def load_season_table(path, digest):
+    from omfo.snapshot import load_snapshot
+    return load_snapshot(path, digest)
+
+
+def attach_shared_season(source, digest, path):
+    from omfo.shared import attach_or_publish
+    return attach_or_publish(path, digest, source=source)
+
+
+def prepare_season(raw):
+    """Drop the id column and turn the shooting fractions into percentages."""
+    df = raw.drop("Person_id", axis='columns')
+    for col in PERCENTAGE_COLUMNS:
+        # Stored as float32 (schema.SCHEMA): widen and round off the float32
+        # noise first, so 0.476 becomes 47.6 and not 47.600002
+        df[col] = df[col].astype('float64').round(6) * 100
+    return df
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SeasonVersion:
+    """One version of a season file: its tables and everything derived from them."""
+
+    def __init__(self, digest, source, season, raw=None, shared=None, stat=None):
+        self.digest = digest
+        self.source = source
+        self.stat = stat
+        self.season = season
+        self.raw = raw
+        self.shared = shared
+        self.derived = {}
+
+
+# Versions pinned by the current rerun, by cache path (see ``pin_season``)
+_pins = contextvars.ContextVar('omfo_season_pins', default=None)
+
+
+class SeasonCache:
+    """Parses one season file and keeps it until the file changes.
+
+    Every lookup stats the file. When the mtime or size moved, the content
+    hash is recomputed and the file is only re-parsed if the hash differs
+    too (a ``touch`` or a copy of identical data is still a hit).
+
+    A background refresher (``omfo.refresh``) can instead ``prepare`` the
+    next version off the request path, warm it and ``activate`` it. While
+    ``managed`` is set, lookups never switch versions themselves.
+    """
+
+    def __init__(self, path, reader=load_season_table, attach=attach_shared_season):
+        self.path = path
+        self.reader = reader
+        self.attach = attach
+        self.managed = False
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._active = None
+        self._prepared = None
+
+    def prepare(self, digest, source=None):
+        """Load (without activating) the version of the file whose content hash is ``digest``.
+
+        ``source`` is where that content is now, if not yet at ``path``
+        (e.g. a report staged next to it).
+        """
+        source = source or self.path
+        shared = self.attach(source, digest, self.path) if self.attach else None
+        if shared is not None:
+            # Mapped from the shared files; the raw table is only read if asked for
+            version = SeasonVersion(digest, source, shared.season, shared=shared)
+        else:
+            raw = self.reader(source, digest)
+            version = SeasonVersion(digest, source, prepare_season(raw), raw=raw)
+        with self._lock:
+            self._prepared = version
+        return version
+
+    def activate(self, version):
+        """Serve ``version`` from now on; reruns that pinned the old one keep it."""
+        st = os.stat(self.path)
+        with self._lock:
+            version.stat = (st.st_mtime_ns, st.st_size)
+            version.source = self.path
+            self._active = version
+            if self._prepared is version:
+                self._prepared = None
+
+    def changed(self):
+        """Content hash of the file if it differs from the active version, else ``None``."""
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        active = self._active
+        if active is not None and stat_key == active.stat:
+            return None
+        digest = file_digest(self.path)
+        if active is not None and digest == active.digest:
+            active.stat = stat_key
+            return None
+        return digest
+
+    def _refresh(self):
+        active = self._active
+        if active is not None and self.managed:
+            self.hits += 1
+            return active
+        st = os.stat(self.path)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if active is not None and stat_key == active.stat:
+            self.hits += 1
+            return active
+        digest = file_digest(self.path)
+        if active is not None and digest == active.digest:
+            active.stat = stat_key
+            self.hits += 1
+            return active
+        prepared = self._prepared
+        version = prepared if prepared is not None and prepared.digest == digest else self.prepare(digest)
+        version.stat = stat_key
+        self._active = version
+        self._prepared = None
+        self.misses += 1
+        return version
+
+    def current(self):
+        """The version lookups are served from: the one pinned by this rerun, else the file's."""
+        pinned = _pins.get()
+        if pinned and self.path in pinned:
+            return pinned[self.path]
+        with self._lock:
+            return self._refresh()
+
+    def raw(self):
+        version = self.current()
+        with self._lock:
+            if version.raw is None:
+                version.raw = self.reader(version.source, version.digest)
+            return version.raw.copy(deep=False)
+
+    def season(self):
+        return self.current().season.copy(deep=False)
+
+    def derive(self, key, build):
+        """Memoize ``build(season)`` for the file version currently cached.
+
+        Use this for anything computed from the whole table (indexes, team
+        tables, ...) so it is built once per file version, not once per rerun.
+        """
+        version = self.current()
+        with self._lock:
+            if key not in version.derived:
+                version.derived[key] = build(version.season.copy(deep=False))
+            return version.derived[key]
+
+    @property
+    def version(self):
+        """Content hash of the current version (``None`` before the first load)."""
+        pinned = _pins.get()
+        if pinned and self.path in pinned:
+            return pinned[self.path].digest
+        return self._active.digest if self._active is not None else None
+
+    @property
+    def shared(self):
+        """``omfo.shared.SharedSeason`` the current version is mapped from, if any."""
+        return self.current().shared
+
+    def stats(self):
+        return {'path': self.path, 'hits': self.hits, 'misses': self.misses, 'version': self.version}
+
+    def clear(self):
+        with self._lock:
+            self._active = self._prepared = None
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def season_cache(path=SEASON_FILE):
+    """Return the process-wide cache for ``path``."""
+    key = os.path.abspath(path)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = SeasonCache(key)
+        return cache
+
+
+def load_season(path=SEASON_FILE):
+    """Cleaned season table: no ``Person_id``, shooting splits in percent,
+    derived metrics included.
+
+    The result shares memory with the cache. Add or replace columns freely,
+    but don't write into existing ones in place.
+    """
+    return season_cache(path).season()
+
+
+def load_raw_season(path=SEASON_FILE):
+    """Season table as it appears in the file, plus the derived metrics."""
+    return season_cache(path).raw()
+
+
+def derived(key, build, path=SEASON_FILE):
+    """Module-level shortcut for ``season_cache(path).derive(key, build)``."""
+    return season_cache(path).derive(key, build)
+
+
+def cache_stats():
+    """Hit/miss counters for every season file loaded in this process."""
+    with _caches_lock:
+        return [cache.stats() for cache in _caches.values()]
+
+
+def pin_season(path=SEASON_FILE):
+    """Serve the current version of ``path`` to the rest of this rerun.
+
+    Call at the top of a page: a refresh that lands mid-rerun then can't
+    mix tables from two versions. The pin lasts until the next call in the
+    same thread (Streamlit runs each session's reruns on one thread).
+    """
+    cache = season_cache(path)
+    # Not ``current()``: that would return this thread's previous pin
+    with cache._lock:
+        version = cache._refresh()
+    pins = dict(_pins.get() or {})
+    pins[cache.path] = version
+    _pins.set(pins)
+    return version
+
+
+@contextlib.contextmanager
+def pinned(version, path=SEASON_FILE):
+    """Serve ``version`` (e.g. a prepared, not yet active one) inside the block."""
+    pins = dict(_pins.get() or {})
+    pins[season_cache(path).path] = version
+    token = _pins.set(pins)
+    try:
+        yield version
+    finally:
+        _pins.reset(token)
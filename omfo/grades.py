@@ -0,0 +1,55 @@
+"""Helio Grades: position-relative bands of the 'Eff' column.
+
+Each position's best 'Eff' anchors its scale; every band below it is
+``band width`` wide. A player above the first cutoff gets an A, then B, C,
+D and everything else an F.
+"""
+import numpy as np
+import pandas as pd
+
+from omfo.profiling import timed
+
+GRADES = np.array(['A', 'B', 'C', 'D', 'F'])
+
+# Band width per position. Positions not listed (or mapped to None) use a
+# fifth of their Eff range, which is how C, SF and PF have always been graded.
+HELIO_BAND_WIDTHS = {
+    'PG': 3.55,
+    'SG': 2.94,
+}
+
+
+def band_widths(df, widths=None, stat='Eff'):
+    """Per-row band width for ``df``'s position."""
+    widths = HELIO_BAND_WIDTHS if widths is None else widths
+    by_pos = df.groupby('Pos.', observed=True)[stat]
+    default = (by_pos.transform('max') - by_pos.transform('min')) / 5
+    fixed = df['Pos.'].map(widths).astype('float64')
+    return fixed.fillna(default)
+
+
+@timed('grading')
+def helio_grades(df, widths=None, stat='Eff'):
+    """Grade every player against their position in a single vectorized pass.
+
+    Returns a tidy ``Player``/``Pos.``/``Eff``/``Helio Grade`` table in the
+    same row order as ``df``; slice it by position for display.
+    """
+    graded = df[['Player', 'Pos.', stat]].copy()
+    eff = graded[stat].to_numpy(dtype='float64')
+    width = band_widths(graded, widths, stat).to_numpy()
+    cutoff = graded.groupby('Pos.', observed=True)[stat].transform('max').to_numpy(dtype='float64')
+
+    # Cutoffs step down from the positional max one band at a time (A, B, C, D).
+    # A missing Eff (or cutoff) clears none of them and gets an F.
+    band = np.zeros(len(graded), dtype=np.intp)
+    for _ in range(len(GRADES) - 1):
+        cutoff = cutoff - width
+        band += ~(eff > cutoff)
+    graded['Helio Grade'] = GRADES[band]
+    return graded
+
+
+def position_grades(graded, position):
+    """Rows of a ``helio_grades`` table for one position, indexed from zero."""
+    return graded[graded['Pos.'] == position].reset_index(drop=True)
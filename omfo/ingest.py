@@ -0,0 +1,194 @@
+"""Incremental ingestion of daily reports.
+
+Every daily report repeats the whole cumulative table, but only players
+whose team played since the previous report have new numbers.
+``ingest_report`` diffs the report against the previous stored partition on
+``Person_id`` (and team: a player traded mid-season has one row per team)
+and recomputes just what those changes can affect:
+
+* derived metrics for the changed players' teams (team-relative metrics
+  read the team totals, so teammates are recomputed too),
+* Helio Grades for the positions that hold a changed player (grades are
+  relative to the positional best and range),
+* league percentiles for the changed players, placed against the new table
+  by binary search.
+
+The merged table becomes the report's store partition and a per-day delta
+table (one row per added, updated, removed or regraded player) is written
+next to it. The first report of a store has nothing to diff against and is
+processed in full.
+
+Command line::
+
+    python -m omfo.ingest data/2023stats.csv [more reports ...] [--season 2023]
+"""
+import argparse
+import datetime
+import sys
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from omfo.data import file_digest, read_season_csv
+from omfo.grades import helio_grades
+from omfo.metrics import DERIVED_COLUMNS, SEASON_COLUMNS, add_derived_metrics
+from omfo.percentiles import RADAR_COLUMNS, PercentileIndex
+from omfo.store import SOURCE_DIGEST_KEY, STORE_DIR, StatsStore, read_report_header, season_for
+
+# A player traded mid-season has one row per team
+KEY = ['Person_id', 'Team']
+ID_COLUMNS = ['Player', 'Pos.']
+# Box-score columns whose day-over-day change is reported
+DELTA_COLUMNS = [col for col in SEASON_COLUMNS if col not in ID_COLUMNS + KEY]
+
+Ingested = namedtuple('Ingested', ['season', 'date', 'table', 'delta', 'recomputed'])
+
+
+def by_key(df):
+    if df[KEY].duplicated().any():
+        dupes = df.loc[df[KEY].duplicated(), KEY].drop_duplicates().to_numpy().tolist()
+        raise ValueError(f'duplicate Person_id/Team rows in report: {dupes}')
+    return df.set_index(KEY)
+
+
+def diff_reports(previous, current):
+    """``(added, updated, removed)`` Person_id/Team keys between two report tables."""
+    prev, cur = by_key(previous), by_key(current)
+    added = cur.index.difference(prev.index)
+    removed = prev.index.difference(cur.index)
+    common = cur.index.intersection(prev.index)
+    columns = [col for col in cur.columns if col in SEASON_COLUMNS]
+    # Categoricals of two reports have different category sets; compare the values
+    a = cur.loc[common, columns].astype({col: 'object' for col in columns if cur[col].dtype == 'category'})
+    b = prev.loc[common, columns].astype({col: 'object' for col in columns if prev[col].dtype == 'category'})
+    differs = (a != b) & ~(a.isna() & b.isna())
+    return added, common[differs.any(axis=1).to_numpy()], removed
+
+
+def merge_metrics(previous, current, teams):
+    """``current`` with derived metrics, reusing ``previous`` rows outside ``teams``.
+
+    Metrics are recomputed over every player of ``teams`` so team totals
+    cover the whole roster; rows of other teams are unchanged since the
+    previous report and keep their stored values.
+    """
+    fresh = add_derived_metrics(current[current['Team'].isin(teams)])
+    keys = pd.MultiIndex.from_frame(current[KEY])
+    kept = previous[~previous['Team'].isin(teams) & pd.MultiIndex.from_frame(previous[KEY]).isin(keys)]
+    merged = pd.concat([kept[fresh.columns], fresh], ignore_index=True)
+    order = pd.MultiIndex.from_frame(merged[KEY]).get_indexer(keys)
+    # Concatenating categoricals with different categories falls back to object
+    return merged.iloc[order].reset_index(drop=True).astype(current.dtypes.to_dict())
+
+
+def regrade(previous, current, positions):
+    """Helio Grades before and after, for the players at ``positions``."""
+    def grades(df):
+        df = df[df['Pos.'].isin(positions)]
+        return pd.Series(helio_grades(df)['Helio Grade'].to_numpy(), index=pd.MultiIndex.from_frame(df[KEY]))
+    return grades(previous), grades(current)
+
+
+def delta_table(previous, current, added, updated, removed, grades_before, grades_after, columns=RADAR_COLUMNS):
+    """One row per player the report changed, with box-score differences."""
+    prev, cur = by_key(previous), by_key(current)
+    regraded = grades_after.index.intersection(grades_before.index)
+    regraded = regraded[(grades_after[regraded] != grades_before[regraded]).to_numpy()]
+    regraded = regraded.difference(added).difference(updated)
+
+    changes = pd.concat([pd.Series('added', index=added), pd.Series('updated', index=updated),
+                         pd.Series('regraded', index=regraded), pd.Series('removed', index=removed)])
+    ids = changes.index
+    present = ids.difference(removed)
+    delta = pd.concat([cur.loc[present, ID_COLUMNS], prev.loc[removed, ID_COLUMNS]]).loc[ids]
+    delta.insert(0, 'Change', changes)
+    # Differences against the previous report (a new player counts from zero)
+    before = prev.reindex(ids)[DELTA_COLUMNS]
+    before[~ids.isin(prev.index)] = 0
+    after = cur.reindex(ids)[DELTA_COLUMNS]
+    after[~ids.isin(cur.index)] = 0
+    delta[DELTA_COLUMNS] = (after - before).astype(cur[DELTA_COLUMNS].dtypes)
+    delta['Eff'] = cur['Eff'].reindex(ids)
+    delta['Previous Helio Grade'] = grades_before.reindex(ids)
+    delta['Helio Grade'] = grades_after.reindex(ids)
+
+    # Percentiles of players with new numbers, against the new league table
+    index = PercentileIndex(current, columns)
+    moved = ids.isin(added.union(updated))
+    pct = np.full((len(ids), len(columns)), np.nan)
+    pct[moved] = index.lookup_many(cur.loc[ids[moved], columns].to_numpy(dtype='float64'))
+    delta[[f'{col} Percentile' for col in columns]] = pct
+    return delta.reset_index()
+
+
+def empty_delta(table):
+    """A ``delta_table`` with no rows."""
+    none = pd.MultiIndex.from_arrays([table['Person_id'].iloc[:0], table['Team'].iloc[:0]], names=KEY)
+    grades = pd.Series([], index=none, dtype='object')
+    return delta_table(table, table, none, none, none, grades, grades)
+
+
+def ingest_report(path, store=None, season=None):
+    """Add one daily report to ``store``, recomputing only what changed.
+
+    Returns an ``Ingested`` record; ``recomputed`` is the number of player
+    rows whose derived metrics were evaluated.
+    """
+    store = StatsStore() if store is None else store
+    name, date = read_report_header(path)
+    season = season or season_for(date)
+    digest = file_digest(path)
+    if (date, season) in store.partitions(season):
+        if store.metadata(season, date).get(SOURCE_DIGEST_KEY) == digest.encode():
+            table = store.load(season, date)
+            try:
+                delta = store.load_delta(season, date)
+            except FileNotFoundError:
+                # Stored by ``StatsStore.ingest``, which writes no change table
+                delta = empty_delta(table)
+            return Ingested(season, date, table, delta, 0)
+        raise ValueError(f'{store.partition_path(season, date)} already holds a different {date} report')
+
+    current = read_season_csv(path)
+    by_key(current)
+    found = store.latest(date - datetime.timedelta(days=1), season)
+    if found is None:
+        previous = current.iloc[:0].reindex(columns=list(current.columns) + DERIVED_COLUMNS)
+    else:
+        previous = store.load(found[1], found[0])
+
+    added, updated, removed = diff_reports(previous, current)
+    changed = added.union(updated)
+    prev, cur = previous.set_index(KEY), current.set_index(KEY)
+    teams = changed.union(removed).get_level_values('Team').unique()
+    table = merge_metrics(previous, current, teams)
+
+    positions = pd.Index(cur.loc[changed, 'Pos.']).union(prev.loc[updated.union(removed), 'Pos.']).unique()
+    grades_before, grades_after = regrade(previous, table, positions)
+    delta = delta_table(previous, table, added, updated, removed, grades_before, grades_after)
+
+    store.write(season, date, table, name, digest)
+    store.write_delta(season, date, delta, name, digest)
+    return Ingested(season, date, table, delta, int(table['Team'].isin(teams).sum()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Ingest daily reports, recomputing only changed players.')
+    parser.add_argument('reports', nargs='+', help='daily report CSV files, oldest first')
+    parser.add_argument('--root', default=STORE_DIR, help='store directory')
+    parser.add_argument('--season', help='season label (default: year of the report date)')
+    args = parser.parse_args(argv)
+
+    store = StatsStore(args.root)
+    for report in args.reports:
+        result = ingest_report(report, store, args.season)
+        counts = result.delta['Change'].value_counts()
+        summary = ', '.join(f'{counts.get(kind, 0)} {kind}' for kind in ['added', 'updated', 'removed', 'regraded'])
+        print(f'{report}: season={result.season} date={result.date} '
+              f'({summary}; metrics recomputed for {result.recomputed} of {len(result.table)} players)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
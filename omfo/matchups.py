@@ -0,0 +1,90 @@
+"""Precomputed team-vs-team funnel matchups.
+
+The Team Matchups funnel shows, for two teams and one statistic, the top
+two players per position across both rosters. ``MatchupMatrix`` builds that
+answer for every ordered team pair and every funnel statistic at once, so
+picking teams in the sidebar is an index lookup. Any player in a pair's
+top N is in their own team's top N, so only those per-team candidates are
+combined.
+
+Export the whole league's matchup sheets with::
+
+    python -m omfo.matchups matchups.csv
+"""
+import argparse
+import sys
+
+import pandas as pd
+
+from omfo.data import SEASON_FILE, derived
+from omfo.metrics import SEASON_COLUMNS, season_metrics
+from omfo.profiling import timed
+from omfo.rankings import rank_long, top_k_per_group
+
+FUNNEL_STATS = ['PPG', 'FG3%', 'FG3A/G', 'AST/G', 'STL/G', 'TOV/G', 'FG%', 'OREB/G', 'DREB/G', 'BLK']
+FUNNEL_TOP_N = 2
+
+
+def funnel_stats(df):
+    """Per-game rates the funnel chart plots, added to a copy of ``df``."""
+    df = df.copy()
+    df['PPG'] = df['PTS'] / df['GP'].round(2)
+    df['FG3%'] = (df['FG3M'] / df['FG3A'] * 100).round(2)
+    df['FG3A/G'] = df['FG3A'] / df['GP'].round(2)
+    df['AST/G'] = df['AST'] / df['GP'].round(2)
+    df['OREB/G'] = df['OREB'] / df['GP'].round(2)
+    df['DREB/G'] = df['DREB'] / df['GP'].round(2)
+    df['BLK/G'] = df['BLK'] / df['GP'].round(2)
+    df['STL/G'] = df['STL'] / df['GP'].round(2)
+    df['TOV/G'] = df['TOV'] / df['GP'].round(2)
+    return df
+
+
+class MatchupMatrix:
+
+    def __init__(self, df, stats=FUNNEL_STATS, n=FUNNEL_TOP_N):
+        self.stats = list(stats)
+        self.n = n
+        self.teams = pd.Index(df['Team'].unique())
+
+        # Each team's own top N per (position, stat): the only candidates a pair can draw from
+        candidates = top_k_per_group(funnel_stats(df), ['Team', 'Pos.'], self.stats, n, carry=['Player'])
+
+        pairs = pd.MultiIndex.from_product([self.teams, self.teams], names=['Team 1', 'Team 2']).to_frame(index=False)
+        side1 = pairs.merge(candidates, left_on='Team 1', right_on='Team').assign(Side=0)
+        side2 = pairs.merge(candidates, left_on='Team 2', right_on='Team').assign(Side=1)
+        both = pd.concat([side1, side2], ignore_index=True)
+
+        # Team 1's players come first in the page's merged frame, so they win ties
+        keys = ['Team 1', 'Team 2', 'Stat', 'Pos.']
+        top = rank_long(both, keys, tiebreak=['Side', 'Order'])
+        top = top[top['Rank'] <= n]
+        self.table = top.set_index(['Team 1', 'Team 2', 'Stat'])[['Pos.', 'Rank', 'Player', 'Team', 'Value']].sort_index()
+
+    @timed('funnel selection')
+    def matchup(self, team1, team2, stat):
+        """Top players per position for one pair, shaped like the page's funnel input."""
+        rows = self.table.loc[(team1, team2, stat)]
+        return rows[['Pos.', 'Player', 'Team', 'Value']].rename(columns={'Value': stat}).reset_index(drop=True)
+
+    def export(self, path_or_buf):
+        self.table.reset_index().to_csv(path_or_buf, index=False)
+
+
+@timed('funnel selection')
+def matchup_matrix(path=SEASON_FILE):
+    """``MatchupMatrix`` for the season file, built once per file version."""
+    return derived('matchup_matrix', lambda season: MatchupMatrix(season_metrics(SEASON_COLUMNS, path)), path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export the funnel matchups of every team pair.')
+    parser.add_argument('out', nargs='?', default='-', help='CSV file to write (default: stdout)')
+    parser.add_argument('--season', default=SEASON_FILE, help='season CSV file')
+    args = parser.parse_args(argv)
+    matchup_matrix(args.season).export(sys.stdout if args.out == '-' else args.out)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,263 @@
+"""Derived player metrics shared by the pages.
+
+Every metric is registered with the columns it reads and a vectorized
+formula. ``MetricFrame`` evaluates them lazily: asking for a column only
+computes its dependency subgraph, and each result is memoized for the life
+of the frame (one frame is kept per season-file version, see
+``season_metrics``).
+"""
+import threading
+from collections import namedtuple
+
+import pandas as pd
+
+from omfo.data import SEASON_FILE, derived
+from omfo.profiling import section, timed
+from omfo.teams import broadcast, team_context
+
+# Box-score columns of a daily report, in file order (without Person_id)
+SEASON_COLUMNS = ['Player', 'Team', 'GP', 'Min', 'FGM', 'FGA', 'FG%', 'FG3M', 'FG3A', 'FG3%', 'FTM', 'FTA', 'FT%',
+                  'OREB', 'DREB', 'REB', 'AST', 'PF', 'STL', 'TOV', 'BLK', 'PTS', 'Pos.']
+
+num_players = 5
+player_min = 24
+
+Metric = namedtuple('Metric', ['name', 'inputs', 'formula'])
+
+METRICS = {}
+
+
+def metric(name, *inputs):
+    """Register ``formula(d)`` as the definition of column ``name``.
+
+    ``d`` only exposes the declared ``inputs``, so a missing declaration
+    fails loudly instead of silently reading a column out of order.
+    """
+    def register(formula):
+        METRICS[name] = Metric(name, inputs, formula)
+        return formula
+    return register
+
+
+@metric('Eff', 'PTS', 'DREB', 'OREB', 'AST', 'STL', 'BLK', 'FGA', 'FGM', 'TOV', 'GP')
+def eff(d):
+    return ((d['PTS'] + (d['DREB'] + d['OREB']) + d['AST'] + d['STL'] + d['BLK'] - (d['FGA'] - d['FGM']) - d['TOV']) / d['GP']).round(2)
+
+
+@metric('Minor_Possessions', 'FGA', 'FTA', 'TOV')
+def minor_possessions(d):
+    return d['FGA'] + 0.44 * d['FTA'] + d['TOV']
+
+
+@metric('Major_Possessions', 'FGA', 'FTA', 'OREB', 'TOV')
+def major_possessions(d):
+    return d['FGA'] + 0.44 * d['FTA'] - d['OREB'] + d['TOV']
+
+
+# Ratio of assists to made field goals for each team
+@metric('TmAst_TmFGM', 'Team', 'AST', 'FGM')
+def team_ast_to_fgm(d):
+    return broadcast(d.team_context(), d['Team'], 'TmAst_TmFGM')
+
+
+# Individual assists per minute (Ast/Min)
+@metric('Ast_Per_Min', 'AST')
+def ast_per_min(d):
+    return d['AST'] / player_min
+
+
+# Team's average assists per minute (TmAst/(TmMin/5))
+@metric('Tm_Avg_Ast_Per_Min', 'Team', 'AST')
+def team_avg_ast_per_min(d):
+    return broadcast(d.team_context(), d['Team'], 'Tm_Avg_Ast_Per_Min')
+
+
+@metric('Ratio_Ast_Per_Min', 'Ast_Per_Min', 'Tm_Avg_Ast_Per_Min')
+def ratio_ast_per_min(d):
+    return d['Ast_Per_Min'] / d['Tm_Avg_Ast_Per_Min']
+
+
+@metric('OReb_Per_Min', 'OREB')
+def oreb_per_min(d):
+    return d['OREB'] / player_min
+
+
+@metric('Off_Reb_Per_48_Min', 'OReb_Per_Min')
+def off_reb_per_48_min(d):
+    return d['OReb_Per_Min'] * 48
+
+
+@metric('Usage', 'Major_Possessions')
+def usage(d):
+    return d['Major_Possessions'] / (player_min / num_players)
+
+
+# (3A/FGA)^2
+@metric('Three_Point_Efficiency', 'FG3A', 'FGA')
+def three_point_efficiency(d):
+    return (d['FG3A'] / d['FGA']) ** 2
+
+
+# (1/Usage)^2
+@metric('Usage_Efficiency', 'Usage')
+def usage_efficiency(d):
+    return (1 / d['Usage']) ** 2
+
+
+@metric('Shooting_Efficiency', 'Three_Point_Efficiency', 'Usage_Efficiency')
+def shooting_efficiency(d):
+    return d['Three_Point_Efficiency'] * d['Usage_Efficiency']
+
+
+# The complete formula with an absolute value
+@metric('Complete_Formula', 'TmAst_TmFGM', 'Ast_Per_Min', 'Tm_Avg_Ast_Per_Min', 'OREB', 'Usage', 'Shooting_Efficiency')
+def complete_formula(d):
+    return abs(d['TmAst_TmFGM'] * (1.53 - 1.442 * (d['Ast_Per_Min'] / d['Tm_Avg_Ast_Per_Min']) -
+                                   0.041 * ((d['OREB'] / player_min) * 48) -
+                                   0.787 * d['Usage'] +
+                                   0.014 * d['Shooting_Efficiency']))
+
+
+# Points Created (PC)
+@metric('PC', 'Complete_Formula', 'FGM')
+def points_created(d):
+    return d['Complete_Formula'] * d['FGM'] * 0.75
+
+
+# Estimated assisted field goals (Afgm)
+@metric('Afgm', 'AST')
+def assisted_fgm(d):
+    return d['AST'] * 0.5
+
+
+# Possessions (Pos)
+@metric('Pos', 'FGA', 'FTA', 'TOV', 'AST', 'Afgm')
+def possessions(d):
+    return d['FGA'] + (0.44 * d['FTA']) + d['TOV'] + (0.375 * d['AST']) - d['Afgm']
+
+
+@metric('Offensive_Rating', 'PC', 'Pos')
+def offensive_rating(d):
+    return (d['PC'] / d['Pos']) * 100
+
+
+@metric('PPG', 'PTS', 'GP')
+def ppg(d):
+    return d['PTS'] / d['GP']
+
+
+@metric('OER', 'PF', 'FGA', 'OREB', 'TOV', 'FTA')
+def oer(d):
+    return d['PF'] / (d['FGA'] - d['OREB'] + d['TOV'] + 0.44 * d['FTA'])
+
+
+# Assists per turnover, shown (lowest first) on the Player Tendencies page
+@metric('Careless Index', 'AST', 'TOV')
+def careless_index(d):
+    return (d['AST'] / d['TOV']).round(2)
+
+
+# Everything the snapshot stores on top of the raw report, in registration order
+DERIVED_COLUMNS = list(METRICS)
+
+
+class _Inputs:
+    """The declared inputs of one metric, as seen by its formula."""
+
+    def __init__(self, frame, metric):
+        self._frame = frame
+        self._metric = metric
+
+    def __getitem__(self, name):
+        if name not in self._metric.inputs:
+            raise KeyError(f"metric {self._metric.name!r} reads {name!r} without declaring it")
+        column = self._frame.column(name)
+        # Counts are stored as int16 (schema.SCHEMA); sums of them would wrap past 32767
+        if pd.api.types.is_integer_dtype(column.dtype) and column.dtype.itemsize < 8:
+            column = column.astype('int64')
+        return column
+
+    def frame(self, names):
+        return pd.DataFrame({name: self[name] for name in names})
+
+    def team_context(self):
+        """Team aggregates of the whole base table, computed once per frame."""
+        return self._frame.shared('team_context', lambda: team_context(self._frame.base))
+
+
+class MetricFrame:
+    """Lazily derived columns over one base table."""
+
+    def __init__(self, base, registry=None):
+        self.base = base
+        self.registry = METRICS if registry is None else registry
+        self._computed = {}
+        self._shared = {}
+        self._lock = threading.RLock()
+
+    def plan(self, names):
+        """Metrics that have to be computed for ``names``, in dependency order."""
+        order, seen = [], set()
+
+        def visit(name, path):
+            if name in seen or name in self.base.columns or name in self._computed:
+                return
+            if name in path:
+                raise ValueError(f"metric cycle: {' -> '.join(path + (name,))}")
+            if name not in self.registry:
+                raise KeyError(f"unknown column or metric {name!r}")
+            for dep in self.registry[name].inputs:
+                visit(dep, path + (name,))
+            seen.add(name)
+            order.append(name)
+
+        for name in names:
+            visit(name, ())
+        return order
+
+    def shared(self, key, build):
+        """Memoize an intermediate (e.g. a team table) that several metrics read."""
+        with self._lock:
+            if key not in self._shared:
+                self._shared[key] = build()
+            return self._shared[key]
+
+    def column(self, name):
+        if name in self.base.columns:
+            return self.base[name]
+        with self._lock:
+            if name not in self._computed:
+                with section('metric computation'):
+                    for todo in self.plan([name]):
+                        metric = self.registry[todo]
+                        self._computed[todo] = metric.formula(_Inputs(self, metric)).rename(todo)
+            return self._computed[name]
+
+    def frame(self, names):
+        """The requested base and derived columns, aligned with the base index.
+
+        The columns are views of the cached ones (no copy per rerun); add or
+        replace columns on the result, but don't write into them in place.
+        """
+        return pd.DataFrame({name: self.column(name) for name in names}, index=self.base.index, copy=False)
+
+    def computed(self):
+        """Names of the metrics evaluated so far (the base table's own columns excluded)."""
+        return list(self._computed)
+
+
+def add_derived_metrics(raw, columns=None):
+    """Return ``raw`` with the requested metrics (default: all of them) appended."""
+    metrics = MetricFrame(raw)
+    columns = DERIVED_COLUMNS if columns is None else columns
+    return pd.concat([raw, metrics.frame(columns)], axis=1)
+
+
+@timed('data load')
+def season_metrics(columns, path=SEASON_FILE):
+    """The requested columns of the cleaned season table.
+
+    Anything the snapshot already holds is returned as is; other registered
+    metrics are computed on first use and memoized until the file changes.
+    """
+    return derived('metric_frame', MetricFrame, path).frame(columns)
@@ -0,0 +1,328 @@
+"""Read tables straight out of Apple Numbers documents.
+
+A ``.numbers`` file (some exports in ``data/`` carry a ``.csv`` name) is a
+zip of ``.iwa`` chunks: snappy-compressed runs of protobuf messages. Only
+the members a table needs are read from the archive, in memory: the table
+model, its cell tiles and its string list. Only the cells of the requested
+columns are decoded. The result has the same columns and dtypes as
+``pd.read_csv`` on the CSV export.
+
+    df = read_numbers_table('data/2023stats.numbers', columns=['Player', 'PTS'])
+"""
+import re
+import struct
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+# Message types of the table archives (TST.TableModelArchive, TST.Tile, TST.TableDataList)
+TABLE_MODEL = 6001
+TILE = 6002
+DATA_LIST = 6005
+
+_EMPTY = 0xFFFF
+_NUMBER_CELLS = {2, 7, 10}
+_TEXT_CELL = 3
+_BOOL_CELL = 6
+_TABLE_MEMBER = re.compile(r'^Index/Tables/\w+-(\d+)\.iwa$')
+
+
+def snappy_decompress(buf):
+    """Decode one raw snappy block (IWA chunks carry no framing or checksums)."""
+    size, pos = _varint(buf, 0)
+    out = bytearray()
+    while pos < len(buf):
+        tag = buf[pos]
+        pos += 1
+        kind = tag & 3
+        if kind == 0:
+            length = tag >> 2
+            if length >= 60:
+                width = length - 59
+                length = int.from_bytes(buf[pos:pos + width], 'little')
+                pos += width
+            length += 1
+            out += buf[pos:pos + length]
+            pos += length
+            continue
+        if kind == 1:
+            length = ((tag >> 2) & 7) + 4
+            offset = ((tag >> 5) << 8) | buf[pos]
+            pos += 1
+        elif kind == 2:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(buf[pos:pos + 2], 'little')
+            pos += 2
+        else:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(buf[pos:pos + 4], 'little')
+            pos += 4
+        start = len(out) - offset
+        if offset >= length:
+            out += out[start:start + length]
+        else:
+            # Overlapping copy: the last ``offset`` bytes repeat
+            out += (out[start:] * (length // offset + 1))[:length]
+    if len(out) != size:
+        raise ValueError(f'corrupt snappy block: {len(out)} bytes, expected {size}')
+    return bytes(out)
+
+
+def _varint(buf, pos):
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        shift += 7
+        if byte < 0x80:
+            return result, pos
+
+
+def fields(buf):
+    """``(field number, value)`` pairs of a protobuf message, without a schema."""
+    pos = 0
+    while pos < len(buf):
+        key, pos = _varint(buf, pos)
+        wire = key & 7
+        if wire == 0:
+            value, pos = _varint(buf, pos)
+        elif wire == 1:
+            value, pos = buf[pos:pos + 8], pos + 8
+        elif wire == 2:
+            length, pos = _varint(buf, pos)
+            value, pos = buf[pos:pos + length], pos + length
+        elif wire == 5:
+            value, pos = buf[pos:pos + 4], pos + 4
+        else:
+            raise ValueError(f'unsupported protobuf wire type {wire}')
+        yield key >> 3, value
+
+
+def message(buf):
+    """Fields of a message as ``{field: [values]}``."""
+    out = {}
+    for field, value in fields(buf):
+        out.setdefault(field, []).append(value)
+    return out
+
+
+def _reference(buf):
+    return message(buf)[1][0]
+
+
+def iwa_objects(data, types=None):
+    """``(identifier, type, payload)`` of every object in an ``.iwa`` member.
+
+    Payloads of other ``types`` are skipped without being copied.
+    """
+    plain = bytearray()
+    pos = 0
+    while pos < len(data):
+        if data[pos] != 0:
+            raise ValueError('not an IWA chunk')
+        length = int.from_bytes(data[pos + 1:pos + 4], 'little')
+        plain += snappy_decompress(data[pos + 4:pos + 4 + length])
+        pos += 4 + length
+    plain = memoryview(plain)
+    pos = 0
+    while pos < len(plain):
+        length, pos = _varint(plain, pos)
+        info = message(plain[pos:pos + length])
+        pos += length
+        identifier = info[1][0]
+        for entry in info.get(2, []):
+            entry = message(entry)
+            kind, size = entry[1][0], entry[3][0]
+            if types is None or kind in types:
+                yield identifier, kind, bytes(plain[pos:pos + size])
+            pos += size
+
+
+def _decimal128(buf):
+    exponent = (((buf[15] & 0x7F) << 7) | (buf[14] >> 1)) - 0x1820
+    mantissa = buf[14] & 1
+    for byte in reversed(buf[:14]):
+        mantissa = (mantissa << 8) | byte
+    if buf[15] & 0x80:
+        mantissa = -mantissa
+    # Through the decimal string so 0.476 reads back exactly as the CSV's 0.476
+    return float(f'{mantissa}e{exponent}')
+
+
+def _cell_value(buf, strings):
+    """Value of one cell record (storage version 5), ``None`` when empty."""
+    if buf[0] != 5:
+        raise ValueError(f'unsupported Numbers cell storage version {buf[0]}')
+    kind = buf[1]
+    flags = struct.unpack_from('<I', buf, 8)[0]
+    pos = 12
+    decimal = double = seconds = string_id = None
+    if flags & 0x1:
+        decimal = _decimal128(buf[pos:pos + 16])
+        pos += 16
+    if flags & 0x2:
+        double = struct.unpack_from('<d', buf, pos)[0]
+        pos += 8
+    if flags & 0x4:
+        seconds = struct.unpack_from('<d', buf, pos)[0]
+        pos += 8
+    if flags & 0x8:
+        string_id = struct.unpack_from('<i', buf, pos)[0]
+    if kind == _TEXT_CELL:
+        return strings[string_id]
+    if kind in _NUMBER_CELLS:
+        return decimal if decimal is not None else double
+    if kind == _BOOL_CELL:
+        return bool(double)
+    if kind == 5:
+        return pd.Timestamp('2001-01-01') + pd.Timedelta(seconds=seconds)
+    return None
+
+
+class NumbersDocument:
+    """One ``.numbers`` archive, opened for reading a table at a time."""
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._members = {}
+        for name in self._zip.namelist():
+            match = _TABLE_MEMBER.match(name)
+            if match:
+                self._members[int(match.group(1))] = name
+        self._models = None
+        self._objects = {}
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _object(self, identifier, kind):
+        # Tiles and lists live in their own member, named after the object id
+        if identifier not in self._objects:
+            for ident, _, payload in iwa_objects(self._zip.read(self._members[identifier]), {kind}):
+                if ident == identifier:
+                    self._objects[identifier] = payload
+                    break
+            else:
+                raise KeyError(f'{self.path}: object {identifier} not found')
+        return self._objects[identifier]
+
+    def models(self):
+        """``{table name: TableModelArchive fields}`` of every table in the document."""
+        if self._models is None:
+            self._models = {}
+            for name in self._zip.namelist():
+                if name.startswith('Index/') and name.endswith('.iwa') and not name.startswith('Index/Tables/'):
+                    for _, _, payload in iwa_objects(self._zip.read(name), {TABLE_MODEL}):
+                        model = message(payload)
+                        self._models[model[8][0].decode()] = model
+        return self._models
+
+    def shape(self, table=None):
+        model = self._model(table)
+        return model[6][0], model[7][0]
+
+    def _model(self, table):
+        models = self.models()
+        if not models:
+            raise ValueError(f'{self.path}: no tables')
+        if table is None:
+            return max(models.values(), key=lambda m: m[6][0] * m[7][0])
+        return models[table]
+
+    def rows(self, table=None, columns=None, rows=None):
+        """Row-major cell values of ``table`` (default: the largest one).
+
+        ``columns`` and ``rows`` (ranges or lists of positions) limit
+        decoding to those cells.
+        """
+        model = self._model(table)
+        n_rows, n_columns = model[6][0], model[7][0]
+        columns = range(n_columns) if columns is None else columns
+        rows = range(n_rows) if rows is None else rows
+        store = message(model[4][0])
+        strings = {}
+        for entry in message(self._object(_reference(store[4][0]), DATA_LIST)).get(3, []):
+            entry = message(entry)
+            if 3 in entry:
+                strings[entry[1][0]] = entry[3][0].decode()
+
+        grid = {index: [None] * len(columns) for index in rows}
+        tiles = message(store[3][0])
+        tile_rows = tiles.get(2, [256])[0]
+        for tile in tiles.get(1, []):
+            tile = message(tile)
+            first_row = tile[1][0] * tile_rows
+            for row in message(self._object(_reference(tile[2][0]), TILE)).get(5, []):
+                row = message(row)
+                if 6 not in row:
+                    raise ValueError(f'{self.path}: only current Numbers cell storage is supported')
+                buffer, offsets = row[6][0], row[7][0]
+                wide = row.get(8, [0])[0]
+                index = first_row + row[1][0]
+                if index not in grid:
+                    continue
+                for out, col in enumerate(columns):
+                    offset = struct.unpack_from('<H', offsets, 2 * col)[0] if 2 * col < len(offsets) else _EMPTY
+                    if offset != _EMPTY:
+                        grid[index][out] = _cell_value(buffer[offset * 4 if wide else offset:], strings)
+        return [grid[index] for index in rows]
+
+
+def _typed(values):
+    """Column dtype as ``pd.read_csv`` would infer it from the CSV export."""
+    series = pd.Series(values, dtype='object')
+    present = series.dropna()
+    if any(isinstance(v, str) for v in present):
+        # Numbers stores a player named '630' as a number; CSV text keeps it a string
+        text = series.map(lambda v: v if isinstance(v, str) or v is None else
+                          str(int(v)) if float(v).is_integer() else str(v))
+        return text.where(text.notna(), np.nan)
+    numeric = pd.to_numeric(series)
+    if numeric.notna().all() and (numeric == numeric.round()).all():
+        return numeric.astype('int64')
+    return numeric.astype('float64')
+
+
+def _title_row(row):
+    # A daily report's first row is its name and date in a single cell
+    return sum(value is not None for value in row) == 1 and isinstance(row[0], str)
+
+
+def read_numbers_table(path, columns=None, table=None):
+    """The table of a Numbers report as a frame, like ``read_season_csv`` on its CSV export.
+
+    The column names are on the first row, or on the second when the first
+    holds the report name. ``columns`` picks the columns to decode.
+    """
+    with NumbersDocument(path) as doc:
+        first, second = doc.rows(table, rows=[0, 1])
+        header_row, names = (1, second) if _title_row(first) else (0, first)
+        if columns is None:
+            positions = [i for i, name in enumerate(names) if name is not None]
+        else:
+            missing = [col for col in columns if col not in names]
+            if missing:
+                raise KeyError(f'{path}: no columns {missing}')
+            positions = [names.index(col) for col in columns]
+        header = [names[i] for i in positions]
+        grid = doc.rows(table, positions, range(header_row + 1, doc.shape(table)[0]))
+    grid = [row for row in grid if any(value is not None for value in row)]
+    return pd.DataFrame({name: _typed([row[i] for row in grid]) for i, name in enumerate(header)})
+
+
+def report_name(path, table=None):
+    """A daily report's name and date: its title row, or else the table's name."""
+    with NumbersDocument(path) as doc:
+        first = doc.rows(table, rows=[0])[0]
+        if _title_row(first):
+            return first[0]
+        return doc._model(table)[8][0].decode()
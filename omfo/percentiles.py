@@ -0,0 +1,58 @@
+"""League percentile ranks without a full-column scan per lookup.
+
+``PercentileIndex`` sorts every stat once. A player's rank is then a row
+of a precomputed matrix and any other value (a positional average, a
+hypothetical stat line) is placed by binary search. Ranks match
+``scipy.stats.percentileofscore(kind='rank')`` divided by 100.
+"""
+import numpy as np
+import pandas as pd
+
+from omfo.data import SEASON_FILE, derived
+from omfo.metrics import season_metrics
+from omfo.profiling import timed
+
+# Stats shown on the Value Finder radar charts, in chart order
+RADAR_COLUMNS = ['PTS', 'AST', 'FT%', 'FTA', 'FTM', 'FG3%', 'FG3A', 'FG3M', 'FG%', 'FGA', 'FGM', 'PPG', 'STL', 'Complete_Formula']
+
+
+class PercentileIndex:
+
+    def __init__(self, df, columns=RADAR_COLUMNS):
+        self.columns = list(columns)
+        values = df[self.columns].to_numpy(dtype='float64')
+        self._n = len(values)
+        self._sorted = np.sort(values, axis=0)
+        # Like percentileofscore, a column holding a NaN ranks everything as NaN
+        self._nan_columns = np.isnan(values).any(axis=0)
+        self.ranks = pd.DataFrame(self.lookup_many(values), index=df.index, columns=self.columns)
+
+    @timed('percentile lookup')
+    def lookup_many(self, values):
+        """Percentiles (0-1) for an ``(m, len(columns))`` array of stat lines."""
+        values = np.asarray(values, dtype='float64').reshape(-1, len(self.columns))
+        out = np.full(values.shape, np.nan)
+        if self._n == 0:
+            return out
+        for j in range(len(self.columns)):
+            col = self._sorted[:, j]
+            left = np.searchsorted(col, values[:, j], side='left')
+            right = np.searchsorted(col, values[:, j], side='right')
+            out[:, j] = (left + right + (left < right)) * (0.5 / self._n)
+        out[:, self._nan_columns] = np.nan
+        out[np.isnan(values)] = np.nan
+        return out
+
+    def lookup(self, values):
+        """Percentiles for one stat line given as a Series/dict keyed by column."""
+        return self.lookup_many([values[col] for col in self.columns])[0]
+
+    def player(self, label):
+        """Precomputed percentiles of the row labelled ``label`` in the indexed frame."""
+        return self.ranks.loc[label].to_numpy()
+
+
+def percentile_index(columns=RADAR_COLUMNS, path=SEASON_FILE):
+    """League-wide ``PercentileIndex``, built once per season file version."""
+    columns = tuple(columns)
+    return derived(('percentiles', columns), lambda df: PercentileIndex(season_metrics(columns, path), columns), path)
@@ -0,0 +1,132 @@
+"""Per-rerun timings of named sections.
+
+A page starts a ``Profile`` at the top of every rerun. Sections marked with
+``with section('grading'):`` or ``@timed('grading')`` add their wall time to
+the profile of the rerun running in the current thread. When no profile is
+active (command-line tools, benchmarks) a section costs one context-variable
+lookup. Finishing a profile writes one JSON line to the ``omfo.perf`` logger,
+which prints to stderr. Set ``OMFO_PERF_LOG=/path/perf.jsonl`` to append the
+lines to that file instead.
+"""
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger('omfo.perf')
+
+# Reruns kept per page for the rolling view of the panel
+HISTORY_SIZE = 50
+
+_current = contextvars.ContextVar('omfo_profile', default=None)
+_history = {}
+_history_lock = threading.Lock()
+
+
+def _configure_log(path=os.environ.get('OMFO_PERF_LOG')):
+    # Streamlit doesn't configure the root logger, so records need a handler of their own
+    handler = logging.FileHandler(path) if path else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    # Not a second time through a root handler (serve.py configures one)
+    logger.propagate = False
+
+
+_configure_log()
+
+
+class Profile:
+    """Sections timed during one rerun of one page."""
+
+    def __init__(self, page, **fields):
+        self.page = page
+        self.fields = fields
+        self.sections = []
+        self.depth = 0
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self.total = None
+
+    def record(self, name, seconds, depth=0):
+        self.sections.append((name, seconds, depth))
+
+    def totals(self):
+        """``{section: seconds}`` summed over repeated sections, in first-seen order.
+
+        Nested sections are included in their parent's time as well.
+        """
+        out = {}
+        for name, seconds, _ in self.sections:
+            out[name] = out.get(name, 0.0) + seconds
+        return out
+
+    def to_dict(self):
+        return {
+            'ts': self.started,
+            'page': self.page,
+            **self.fields,
+            'total_s': self.total,
+            'sections': [{'name': n, 's': round(s, 6), 'depth': d} for n, s, d in self.sections],
+        }
+
+    def finish(self):
+        """Stop the clock, log the rerun and add it to the page's history."""
+        self.total = time.perf_counter() - self._start
+        if _current.get() is self:
+            _current.set(None)
+        record = self.to_dict()
+        logger.info(json.dumps(record))
+        with _history_lock:
+            _history.setdefault(self.page, deque(maxlen=HISTORY_SIZE)).append(record)
+        return record
+
+
+def start(page, **fields):
+    """Begin profiling a rerun of ``page`` in the current thread."""
+    profile = Profile(page, **fields)
+    _current.set(profile)
+    return profile
+
+
+def current():
+    return _current.get()
+
+
+@contextlib.contextmanager
+def section(name):
+    """Time the enclosed block into the current rerun's profile, if any."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    depth = profile.depth
+    profile.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.depth = depth
+        profile.record(name, time.perf_counter() - start, depth)
+
+
+def timed(name):
+    """Decorator form of ``section``."""
+    def wrap(func):
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            with section(name):
+                return func(*args, **kwargs)
+        return inner
+    return wrap
+
+
+def history(page):
+    """Recent rerun records of ``page``, oldest first."""
+    with _history_lock:
+        return list(_history.get(page, ()))
@@ -0,0 +1,199 @@
+"""Percentile radar charts for the Value Finder.
+
+``RadarRenderer`` keeps a small pool of pre-styled polar figures per
+(layout, metric list, style): ticks, grid and labels are laid out once and
+each request only draws the data polygons, saves the PNG and strips the
+polygons off again. The figures are plain ``matplotlib.figure.Figure``
+objects on an Agg canvas, so nothing is registered with pyplot and no
+figure outlives its pool slot. matplotlib itself is imported on the first
+render, so importing this module (and the pages that do) stays cheap.
+"""
+import io
+import sys
+import threading
+
+import numpy as np
+
+from omfo.chart_cache import chart_cache
+from omfo.profiling import timed
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+RADAR_STYLE = 'dark_background'
+PERCENT_TICKS = np.linspace(0, 1, 5)
+PERCENT_LABELS = ['0%', '25%', '50%', '75%', '100%']
+
+# Same options st.pyplot uses, so cached PNGs look like the old inline charts
+SAVEFIG_OPTIONS = {'format': 'png', 'bbox_inches': 'tight', 'dpi': 200}
+
+# rcParams (and therefore style contexts) are process-global, so anything
+# drawing with matplotlib in this process renders one figure at a time
+render_lock = threading.Lock()
+
+
+def radar_angles(n):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.concatenate((angles, [angles[0]]))
+
+
+def closed(values):
+    values = list(values)
+    return values + [values[0]]
+
+
+def figure_png(fig):
+    """Serialize ``fig`` like ``st.pyplot`` would and close it if pyplot owns it."""
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, **SAVEFIG_OPTIONS)
+    finally:
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close(fig)
+    return buf.getvalue()
+
+
+class _Template:
+
+    def __init__(self, fig, axes, angles, colors):
+        self.fig = fig
+        self.axes = axes
+        self.angles = angles
+        self.colors = colors
+        self.artists = []
+
+    def plot(self, ax, ranks, fill=False, **kwargs):
+        self.artists += ax.plot(self.angles, closed(ranks), linewidth=2, **kwargs)
+        if fill:
+            self.artists += ax.fill(self.angles, closed(ranks), alpha=0.25, color=kwargs.get('color'))
+
+    def reset(self):
+        for artist in self.artists:
+            artist.remove()
+        self.artists = []
+        for ax in self.axes:
+            if ax.get_legend() is not None:
+                ax.get_legend().remove()
+            ax.set_title('')
+
+
+class RadarRenderer:
+    """Draws radar PNGs from pooled, pre-styled figure templates."""
+
+    def __init__(self, max_idle_per_template=2):
+        self.max_idle_per_template = max_idle_per_template
+        self.renders = 0
+        self.templates_built = 0
+        self._idle = {}
+        self._lock = render_lock
+
+    def _build(self, kind, columns):
+        from matplotlib import rcParams
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        angles = radar_angles(len(columns))
+        if kind == 'side_by_side':
+            fig = Figure(figsize=(24, 9))
+            axes = list(fig.subplots(1, 2, subplot_kw={'polar': True}))
+            fig.subplots_adjust(wspace=0.4)
+        else:
+            fig = Figure(figsize=(12, 9))
+            axes = [fig.add_subplot(111, polar=True)]
+        FigureCanvasAgg(fig)
+        for ax in axes:
+            ax.set_xticks(angles[:-1])
+            ax.set_xticklabels(columns, color='white', size=8)
+            ax.set_yticks(PERCENT_TICKS, PERCENT_LABELS, color='white', size=7)
+        colors = rcParams['axes.prop_cycle'].by_key().get('color', ['C0', 'C1'])
+        self.templates_built += 1
+        return _Template(fig, axes, angles, colors)
+
+    @timed('figure render')
+    def _render(self, kind, columns, style, draw, fmt='png'):
+        import matplotlib.style
+
+        key = (kind, tuple(columns), style)
+        with self._lock, matplotlib.style.context(style):
+            idle = self._idle.setdefault(key, [])
+            template = idle.pop() if idle else self._build(kind, columns)
+            buf = io.BytesIO()
+            try:
+                draw(template)
+                # Limits must follow this request's data, not whatever the slot drew last
+                for ax in template.axes:
+                    ax.relim()
+                    ax.autoscale_view()
+                template.fig.savefig(buf, **{**SAVEFIG_OPTIONS, 'format': fmt})
+            finally:
+                template.reset()
+                if len(idle) < self.max_idle_per_template:
+                    idle.append(template)
+            self.renders += 1
+        return buf.getvalue()
+
+    def player_vs_average(self, player_ranks, avg_ranks, player_name, position, columns, style=RADAR_STYLE,
+                          fmt='png'):
+        def draw(t):
+            ax = t.axes[0]
+            t.plot(ax, player_ranks, fill=True, label=player_name, color=t.colors[0])
+            t.plot(ax, avg_ranks, label=f'Avg {position}', color=t.colors[1 % len(t.colors)])
+            ax.set_title(f'{player_name} vs. Avg {position} Percentile Comparison')
+            ax.legend(loc='upper right', bbox_to_anchor=(1, 1))
+        return self._render('player_vs_average', columns, style, draw, fmt)
+
+    def side_by_side(self, ranks1, player_name1, ranks2, player_name2, columns, style=RADAR_STYLE, fmt='png'):
+        def draw(t):
+            for ax, ranks, player_name in zip(t.axes, (ranks1, ranks2), (player_name1, player_name2)):
+                t.plot(ax, ranks, fill=True, label=player_name, color=t.colors[0])
+                ax.set_title(f'{player_name} Percentile Comparison', color='white')
+        return self._render('side_by_side', columns, style, draw, fmt)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+
+    def stats(self):
+        """Pool and memory figures for monitoring.
+
+        ``max_rss_kb`` is the process peak resident size (``None`` where the
+        ``resource`` module is missing); ``pyplot_figures`` counts figures
+        still registered with pyplot, which should stay at zero.
+        """
+        with self._lock:
+            pooled = sum(len(idle) for idle in self._idle.values())
+            canvas_bytes = 0
+            for idle in self._idle.values():
+                for t in idle:
+                    renderer = getattr(t.fig.canvas, 'renderer', None)
+                    if renderer is not None:
+                        canvas_bytes += int(renderer.width * renderer.height * 4)
+        pyplot = sys.modules.get('matplotlib.pyplot')
+        return {
+            'renders': self.renders,
+            'templates_built': self.templates_built,
+            'templates_pooled': pooled,
+            'template_canvas_bytes': canvas_bytes,
+            'pyplot_figures': len(pyplot.get_fignums()) if pyplot else 0,
+            'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        }
+
+
+_radar_renderer = RadarRenderer()
+
+
+def radar_renderer():
+    """The renderer shared by every session in this process."""
+    return _radar_renderer
+
+
+def cached_radar(key, render, style=RADAR_STYLE, cache=None):
+    """PNG for a radar chart, produced by ``render(style)`` only on a cache miss.
+
+    ``key`` should identify the data version, position, player(s) and
+    metric list; the style is appended here.
+    """
+    cache = chart_cache() if cache is None else cache
+    return cache.get_or_render((*key, style), lambda: render(style))
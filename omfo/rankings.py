@@ -0,0 +1,191 @@
+"""Ranking primitives shared by the funnel chart and the leaderboards.
+
+The batch helpers work on a long table with one row per (player, stat), so
+every statistic is ranked in the same single sort instead of one
+``nlargest`` call per group and stat. ``LeaderboardIndex`` keeps those
+rankings sorted so a daily report that changes a handful of players only
+moves their entries.
+"""
+import bisect
+
+import numpy as np
+
+from omfo.data import SEASON_FILE, derived
+from omfo.metrics import season_metrics
+from omfo.profiling import timed
+
+
+def stats_long(df, stats, carry=()):
+    """One row per (row of ``df``, stat): the ``carry`` columns, 'Order', 'Stat' and 'Value'.
+
+    'Order' is the row's position in ``df`` and breaks ties, so equal values
+    keep their original order.
+    """
+    long = df[[*carry, *stats]].assign(Order=np.arange(len(df)))
+    return long.melt(id_vars=['Order', *carry], value_vars=list(stats), var_name='Stat', value_name='Value')
+
+
+def rank_long(long, keys, tiebreak=('Order',), ascending=False):
+    """Sort a long table within ``keys`` groups and number the rows 'Rank' 1, 2, ...
+
+    Values run best-first (highest unless ``ascending``), NaN last, ties by
+    ``tiebreak``, which matches ``DataFrame.nlargest(keep='first')``.
+    """
+    keys, tiebreak = list(keys), list(tiebreak)
+    ordered = long.sort_values(keys + ['Value'] + tiebreak,
+                               ascending=[True] * len(keys) + [ascending] + [True] * len(tiebreak),
+                               kind='stable', na_position='last')
+    return ordered.assign(Rank=ordered.groupby(keys, sort=False, observed=True).cumcount() + 1)
+
+
+def rank_per_group(df, by, stats, carry=('Player',), ascending=False):
+    """Rank every row on every stat inside its ``by`` group, as a long table."""
+    by = [by] if isinstance(by, str) else list(by)
+    carry = by + [col for col in carry if col not in by]
+    return rank_long(stats_long(df, stats, carry), ['Stat', *by], ascending=ascending)
+
+
+def top_k_per_group(df, by, stats, k, carry=('Player',), ascending=False):
+    """The best ``k`` rows per ``by`` group for each of ``stats``, in one sort."""
+    ranked = rank_per_group(df, by, stats, carry, ascending)
+    return ranked[ranked['Rank'] <= k]
+
+
+class Leaderboard:
+    """One stat's ranking inside one group, kept sorted between updates.
+
+    Entries are ``(id, value)``; ties are broken by id and NaN always sorts
+    last. Lookups are binary searches over the sorted keys. An update
+    removes and re-inserts a single key instead of re-sorting the board.
+    """
+
+    def __init__(self, ascending=False):
+        self.ascending = ascending
+        self._keys = []
+        self._by_id = {}
+
+    def _key(self, id_, value):
+        if value != value:  # NaN
+            return (1, 0.0, id_)
+        return (0, value if self.ascending else -value, id_)
+
+    def _value(self, key):
+        if key[0]:
+            return np.nan
+        return key[1] if self.ascending else -key[1]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, id_):
+        return id_ in self._by_id
+
+    def insert(self, id_, value):
+        if id_ in self._by_id:
+            self.remove(id_)
+        key = self._key(id_, float(value))
+        bisect.insort(self._keys, key)
+        self._by_id[id_] = key
+
+    def remove(self, id_):
+        key = self._by_id.pop(id_)
+        del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def top(self, k=None):
+        """The best ``k`` (default: all) entries as ``(id, value)`` pairs."""
+        return [(key[2], self._value(key)) for key in self._keys[:k]]
+
+    def rank(self, id_):
+        """1-based position of ``id_``."""
+        return bisect.bisect_left(self._keys, self._by_id[id_]) + 1
+
+    def value_at(self, rank):
+        """Value at 1-based ``rank`` (``value_at(1)`` is the best value on the board)."""
+        return self._value(self._keys[rank - 1])
+
+    def count_better(self, value, inclusive=True):
+        """How many entries are at least (or, with ``inclusive=False``, strictly) as good as ``value``."""
+        probe = (0, value if self.ascending else -value)
+        if inclusive:
+            return bisect.bisect_right(self._keys, (*probe, _MAX_ID))
+        return bisect.bisect_left(self._keys, probe)
+
+
+class _MaxId:
+    """Sorts after every id, for inclusive searches on a value."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_MAX_ID = _MaxId()
+
+
+class LeaderboardIndex:
+    """A ``Leaderboard`` for every (stat, group), plus a league-wide one per stat.
+
+    Rows are identified by the frame's index labels. ``update`` takes the
+    changed rows of a new report and only touches their entries.
+    """
+
+    LEAGUE = None
+
+    def __init__(self, df, stats, by='Pos.', ascending=()):
+        self.stats = list(stats)
+        self.by = by
+        self.ascending = set(ascending)
+        self._boards = {}
+        self._groups = {}
+        self.update(df)
+
+    def board(self, stat, group=LEAGUE):
+        key = (stat, group)
+        if key not in self._boards:
+            self._boards[key] = Leaderboard(ascending=stat in self.ascending)
+        return self._boards[key]
+
+    def update(self, rows):
+        """Insert or move the rows of ``rows`` (changed players of a new report)."""
+        for id_, group, values in zip(rows.index, rows[self.by], rows[self.stats].itertuples(index=False)):
+            old_group = self._groups.get(id_, group)
+            for stat, value in zip(self.stats, values):
+                if old_group != group and id_ in self.board(stat, old_group):
+                    self.board(stat, old_group).remove(id_)
+                self.board(stat, group).insert(id_, value)
+                self.board(stat).insert(id_, value)
+            self._groups[id_] = group
+
+    def remove(self, ids):
+        for id_ in ids:
+            group = self._groups.pop(id_)
+            for stat in self.stats:
+                self.board(stat, group).remove(id_)
+                self.board(stat).remove(id_)
+
+    def top(self, stat, k=None, group=LEAGUE):
+        return self.board(stat, group).top(k)
+
+    def rank(self, stat, id_, in_group=True):
+        """Rank of ``id_`` on ``stat`` within its group (or the league)."""
+        return self.board(stat, self._groups[id_] if in_group else self.LEAGUE).rank(id_)
+
+    def threshold(self, stat, rank=1, group=LEAGUE):
+        """Value needed to sit at ``rank``; ``threshold(stat, 1, 'PG')`` is the best PG value."""
+        return self.board(stat, group).value_at(rank)
+
+    @timed('ranking')
+    def ordered(self, df, stat, group=LEAGUE, k=None):
+        """Rows of ``df`` in leaderboard order."""
+        return df.loc[[id_ for id_, _ in self.top(stat, k, group)]]
+
+
+def leaderboards(stats, by='Pos.', ascending=(), path=SEASON_FILE):
+    """``LeaderboardIndex`` over the cleaned season, built once per file version."""
+    stats, ascending = tuple(stats), tuple(ascending)
+
+    def build(season):
+        return LeaderboardIndex(season_metrics([by, *stats], path), stats, by, ascending)
+    return derived(('leaderboards', stats, by, ascending), build, path)
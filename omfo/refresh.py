@@ -0,0 +1,267 @@
+"""Background refresh of the season data, off the request path.
+
+New daily reports are dropped into an inbox directory (``data/inbox/`` by
+default). Write them under a dot-name or a ``.tmp`` suffix and rename
+them when complete; files still being written are skipped until their
+mtime settles. For each new report, ``Refresher``:
+
+1. validates it (``schema.validate``) and copies it next to the season file,
+2. prepares the next version: cleaned tables, published to the shared
+   memory-mapped files (``omfo.shared``) without becoming current yet,
+3. warms that version's indexes and popular charts (``omfo.warmup``) while
+   requests keep being served from the current one,
+4. swaps it in: ``os.replace`` onto the season file, then activates the
+   prepared version in this process and points ``CURRENT`` at it,
+5. records the report in the date-partitioned store (``omfo.ingest``) and
+   moves it to ``inbox/done/``. A report that fails validation, or whose
+   version can't be prepared, goes to ``inbox/rejected/`` instead.
+
+Reports are cumulative: when several are waiting, all are recorded in
+date order and only the newest is served. A report dated on or before
+the season file's own report date is recorded but never swapped in.
+
+Pages pin one version at the top of each rerun (``data.pin_season``), so
+a rerun in flight during the swap finishes on the version it started
+with. Nobody sees a partially written file or a cold cache.
+
+Other server processes have no inbox to watch. They follow the season
+file: when its content changes, their refresher prepares, warms and
+activates the new version the same way. If the version was already
+published, that only means mapping it.
+
+    python -m omfo.refresh --once           # process the inbox now (no server)
+    python serve.py --inbox data/inbox      # refresh inside the server
+"""
+import argparse
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+
+from omfo.data import DATA_DIR, SEASON_FILE, file_digest, pinned, read_season_csv, season_cache
+
+logger = logging.getLogger('omfo.refresh')
+
+INBOX_DIR = os.path.join(DATA_DIR, 'inbox')
+# Seconds between polls of the inbox and the season file
+POLL_INTERVAL = 5.0
+# A report must be untouched this long before it is picked up
+SETTLE_SECONDS = 2.0
+REPORT_EXTENSIONS = ('.csv', '.numbers', '.zip')
+
+
+def inbox_reports(inbox, settle=SETTLE_SECONDS, now=None):
+    """Complete reports waiting in ``inbox``, oldest first."""
+    now = time.time() if now is None else now
+    try:
+        entries = list(os.scandir(inbox))
+    except FileNotFoundError:
+        return []
+    ready = [e for e in entries
+             if e.is_file() and not e.name.startswith('.') and e.name.lower().endswith(REPORT_EXTENSIONS)
+             and now - e.stat().st_mtime >= settle]
+    return [e.path for e in sorted(ready, key=lambda e: e.stat().st_mtime_ns)]
+
+
+def report_date(report):
+    """Date in the header of a well-formed daily report; ``ValueError`` otherwise."""
+    from omfo.store import read_report_header
+
+    read_season_csv(report)
+    return read_report_header(report)[1]
+
+
+def _move(path, folder):
+    os.makedirs(folder, exist_ok=True)
+    target = os.path.join(folder, os.path.basename(path))
+    os.replace(path, target)
+    return target
+
+
+class Refresher:
+    """Swaps new season data in without making any request wait for it.
+
+    With ``inbox=None`` it only follows the season file (replicas that
+    share an inbox-watching process's data directory).
+    """
+
+    def __init__(self, path=SEASON_FILE, inbox=INBOX_DIR, warm=True, radars=None, store=None,
+                 interval=POLL_INTERVAL, settle=SETTLE_SECONDS):
+        self.path = os.path.abspath(path)
+        self.inbox = inbox
+        self.warm = warm
+        self.radars = radars
+        self.store = store
+        self.interval = interval
+        self.settle = settle
+        self.refreshes = 0
+        self.last_report = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _warm(self, version):
+        if not self.warm:
+            return
+        from omfo import warmup
+
+        kwargs = {} if self.radars is None else {'radars': self.radars}
+        with pinned(version, self.path):
+            self.last_report = warmup.run(self.path, **kwargs)
+
+    def _activate(self, version):
+        from omfo.shared import set_current
+
+        season_cache(self.path).activate(version)
+        if version.shared is not None:
+            set_current(self.path, version.digest)
+        self.refreshes += 1
+
+    def ingest(self, report):
+        """Make ``report`` the season data. Returns the new version's digest."""
+        cache = season_cache(self.path)
+        directory, name = os.path.split(self.path)
+        staged = os.path.join(directory, f'.{name}.{os.getpid()}.incoming')
+        shutil.copyfile(report, staged)
+        try:
+            digest = file_digest(staged)
+            if digest == cache.version:
+                logger.info('%s: same data as the current version', report)
+                os.remove(staged)
+                return digest
+            start = time.perf_counter()
+            version = cache.prepare(digest, source=staged)
+            self._warm(version)
+            os.replace(staged, self.path)
+        except BaseException:
+            if os.path.exists(staged):
+                os.remove(staged)
+            raise
+        self._activate(version)
+        logger.info('%s: now serving %s (prepared in %.2f s)', report, digest[:12], time.perf_counter() - start)
+        self._snapshot(digest)
+        return digest
+
+    def _snapshot(self, digest):
+        # The columnar snapshot next to the season file, for tools that read it
+        from omfo.snapshot import build_snapshot
+
+        try:
+            build_snapshot(self.path, digest)
+        except OSError as exc:
+            logger.warning('%s: snapshot not rebuilt: %s', self.path, exc)
+
+    def _record(self, report):
+        from omfo.ingest import ingest_report
+        from omfo.store import StatsStore
+
+        try:
+            ingest_report(report, self.store or StatsStore())
+        except (OSError, ValueError) as exc:
+            logger.warning('%s: not added to the report store: %s', report, exc)
+
+    def follow(self):
+        """Adopt a season file changed by someone else (another process, or by hand)."""
+        cache = season_cache(self.path)
+        digest = cache.changed()
+        if digest is None:
+            return False
+        version = cache.prepare(digest)
+        self._warm(version)
+        self._activate(version)
+        logger.info('%s changed: now serving %s', self.path, digest[:12])
+        return True
+
+    def served_date(self):
+        """Report date of the season file being served, or ``None`` if its header has none."""
+        from omfo.store import read_report_header
+
+        try:
+            return read_report_header(self.path)[1]
+        except (OSError, ValueError):
+            return None
+
+    def poll(self):
+        """Process waiting reports (newest wins), else follow the season file."""
+        reports = inbox_reports(self.inbox, self.settle) if self.inbox else []
+        if not reports:
+            return self.follow()
+        dated = []
+        for report in reports:
+            try:
+                dated.append((report_date(report), report))
+            except ValueError as exc:
+                logger.error('%s rejected: %s', report, exc)
+                _move(report, os.path.join(self.inbox, 'rejected'))
+        dated.sort(key=lambda item: item[0])
+        # A report no newer than the one served would roll the data back
+        served = self.served_date()
+        for date, report in dated:
+            if served is not None and date <= served:
+                logger.info('%s: dated %s, not newer than the %s data served; not swapped in', report, date, served)
+                self._record(report)
+                _move(report, os.path.join(self.inbox, 'done'))
+        valid = [report for date, report in dated if served is None or date > served]
+        if not valid:
+            return False
+        # Reports are cumulative, so only the newest has to be served
+        try:
+            self.ingest(valid[-1])
+        except Exception:
+            # Don't prepare it again every poll; older reports get their turn next time
+            logger.exception('%s rejected: could not prepare it', valid[-1])
+            _move(valid[-1], os.path.join(self.inbox, 'rejected'))
+            return False
+        for report in valid:
+            self._record(report)
+            _move(report, os.path.join(self.inbox, 'done'))
+        return True
+
+    def start(self):
+        """Poll in a daemon thread until ``stop``."""
+        season_cache(self.path).managed = True
+        self._thread = threading.Thread(target=self._run, name='omfo-refresh', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception('refresh failed; still serving the previous version')
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        season_cache(self.path).managed = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Swap new daily reports in from an inbox directory.')
+    parser.add_argument('--inbox', default=INBOX_DIR)
+    parser.add_argument('--season', default=SEASON_FILE, help='season file the reports replace')
+    parser.add_argument('--once', action='store_true', help='process the inbox once and exit')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help='seconds between polls')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+    # Without a server there are no caches worth warming
+    refresher = Refresher(args.season, args.inbox, warm=False, interval=args.interval)
+    if args.once:
+        refresher.poll()
+        return 0
+    refresher.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        refresher.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
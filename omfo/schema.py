@@ -0,0 +1,89 @@
+"""Canonical column types of a daily report.
+
+Reports arrive as text (CSV) or Numbers cells and are typed once, on
+ingestion: team and position become categoricals, box-score counts small
+integers and shooting splits float32. The raw table and its snapshot take
+a fraction of the default int64/float64/object memory and team/position
+groupbys work on category codes. The narrow types are for storage only:
+metric formulas read counts as int64, and the cleaned season table holds
+the splits as float64 percentages. ``apply_schema`` validates while it converts and rejects a
+malformed report outright instead of letting a bad row surface as a NaN on
+some page.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+# Bump when the dtypes change so cached snapshots are rebuilt
+SCHEMA_VERSION = '1'
+
+ID_COLUMN = 'Person_id'
+TEXT_COLUMNS = ['Player']
+CATEGORY_COLUMNS = ['Team', 'Pos.']
+COUNT_COLUMNS = ['GP', 'Min', 'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA', 'OREB', 'DREB', 'REB', 'AST', 'PF',
+                 'STL', 'TOV', 'BLK', 'PTS']
+RATE_COLUMNS = ['FG%', 'FG3%', 'FT%']
+
+SCHEMA = {
+    ID_COLUMN: 'int32',
+    **{col: 'object' for col in TEXT_COLUMNS},
+    **{col: 'category' for col in CATEGORY_COLUMNS},
+    # Season totals stay far below 32767 (82 games of 48 minutes is 3936)
+    **{col: 'int16' for col in COUNT_COLUMNS},
+    **{col: 'float32' for col in RATE_COLUMNS},
+}
+
+# PG, SG, SF, PF, C and hybrids such as PF/C or SF/PF
+POSITION_PATTERN = re.compile(r'^(PG|SG|SF|PF|C)(/(PG|SG|SF|PF|C))*$')
+
+_MAX_REPORTED = 10
+
+
+def _problems(raw):
+    """``{column: boolean mask of malformed rows}`` for the schema columns of ``raw``."""
+    bad = {}
+    for col in [ID_COLUMN] + COUNT_COLUMNS:
+        values = pd.to_numeric(raw[col], errors='coerce')
+        limit = np.iinfo(SCHEMA[col]).max
+        bad[col] = values.isna() | (values < 0) | (values > limit) | (values != values.round())
+    for col in RATE_COLUMNS:
+        values = pd.to_numeric(raw[col], errors='coerce')
+        # An empty split (no attempts) is allowed, anything else must be a fraction
+        bad[col] = (values.isna() & raw[col].notna()) | (values < 0) | (values > 1)
+    for col in TEXT_COLUMNS + CATEGORY_COLUMNS:
+        text = raw[col].astype('string').str.strip()
+        bad[col] = text.isna() | (text == '')
+    bad['Pos.'] |= ~raw['Pos.'].astype('string').str.strip().fillna('').str.match(POSITION_PATTERN)
+    return bad
+
+
+def validate(raw, source='report'):
+    """Raise ``ValueError`` naming the first malformed rows of ``raw``."""
+    missing = [col for col in SCHEMA if col not in raw.columns]
+    if missing:
+        raise ValueError(f'{source}: missing columns {missing}')
+    bad = _problems(raw)
+    rows = np.flatnonzero(np.logical_or.reduce([mask.to_numpy() for mask in bad.values()]))
+    if len(rows):
+        details = []
+        for row in rows[:_MAX_REPORTED]:
+            cols = [col for col, mask in bad.items() if mask.iloc[row]]
+            values = ', '.join(f'{col}={raw[col].iloc[row]}' for col in cols)
+            details.append(f'row {row + 1} ({values})')
+        more = f' and {len(rows) - _MAX_REPORTED} more' if len(rows) > _MAX_REPORTED else ''
+        raise ValueError(f'{source}: {len(rows)} malformed rows: {"; ".join(details)}{more}')
+
+
+def apply_schema(raw, source='report'):
+    """``raw`` validated and converted to the canonical dtypes (other columns untouched)."""
+    validate(raw, source)
+    typed = raw.copy()
+    for col, dtype in SCHEMA.items():
+        if dtype == 'category':
+            typed[col] = typed[col].astype('string').str.strip().astype('object').astype('category')
+        elif dtype == 'object':
+            typed[col] = typed[col].astype('string').str.strip().astype('object')
+        else:
+            typed[col] = pd.to_numeric(typed[col]).astype(dtype)
+    return typed
@@ -0,0 +1,218 @@
+"""Scouting reports for the whole league in one archive, without Streamlit.
+
+After a match day, every player's radar, the Helio Grades, the Careless
+Index tables and the team funnels are generated in one run and written
+to a single zip::
+
+    players/<Pos.>/<Player> (<Team>).png  radar vs. the rest of the position
+    funnels/<Team 1> vs <Team 2>/<stat>.png
+    players.csv                           box score, Eff, Helio Grade, Careless Index
+    percentiles.csv                       league percentiles of the radar stats
+    helio_grades.csv, careless_index.csv, teams.csv
+    manifest.json                         data version, counts, timings
+
+The tables are computed once in the main process with the same functions
+the pages use. The charts fan out over a process pool. Workers share
+nothing but the season tables, which they memory-map (``omfo.shared``) or
+inherit when forked. Each chart is one task, and results stream into the
+archive as they finish, so throughput grows with the number of cores and
+memory stays flat. The archive is written under a temporary name and
+renamed when complete.
+
+    python -m omfo.scouting reports.zip
+    python -m omfo.scouting reports.zip --formats png pdf --workers 8 --funnel-stats PPG AST/G
+"""
+import argparse
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import zipfile
+
+from omfo import charts
+from omfo.averages import positional_averages
+from omfo.chart_cache import chart_cache
+from omfo.data import SEASON_FILE, season_cache
+from omfo.grades import helio_grades
+from omfo.matchups import FUNNEL_STATS, matchup_matrix
+from omfo.metrics import SEASON_COLUMNS, season_metrics
+from omfo.percentiles import RADAR_COLUMNS, percentile_index
+from omfo.rankings import leaderboards
+from omfo.teams import team_table
+
+FORMATS = ('png', 'pdf')
+DEFAULT_FUNNEL_STATS = ['PPG']
+# Seconds between progress lines
+PROGRESS_INTERVAL = 0.5
+
+_UNSAFE = re.compile(r'[^\w .()&+-]+')
+
+# Season file of this worker process (set by ``_init_worker``)
+_path = SEASON_FILE
+
+
+def safe_name(name):
+    """``name`` usable as one archive path component."""
+    return _UNSAFE.sub('_', str(name)).strip(' .') or '_'
+
+
+def summary_tables(path=SEASON_FILE):
+    """``{archive name: DataFrame}`` of the CSV summaries."""
+    df = season_metrics(SEASON_COLUMNS + ['Pos.', 'Eff', 'Careless Index'], path)
+    grades = helio_grades(df)
+    players = df.assign(**{'Helio Grade': grades['Helio Grade']})
+
+    percentiles = percentile_index(RADAR_COLUMNS, path).ranks * 100
+    percentiles.insert(0, 'Player', df['Player'])
+    percentiles.insert(1, 'Team', df['Team'])
+    percentiles.insert(2, 'Pos.', df['Pos.'])
+
+    careless = season_metrics(['Player', 'Team', 'Pos.', 'AST', 'TOV', 'Careless Index'], path)
+    boards = leaderboards(['Careless Index'], ascending=['Careless Index'], path=path)
+    return {
+        'players.csv': players,
+        'percentiles.csv': percentiles,
+        'helio_grades.csv': grades.sort_values(['Pos.', 'Eff'], ascending=[True, False], kind='stable'),
+        'careless_index.csv': boards.ordered(careless, 'Careless Index'),
+        'teams.csv': team_table(path).reset_index(),
+    }
+
+
+def chart_tasks(path=SEASON_FILE, formats=('png',), funnel_stats=DEFAULT_FUNNEL_STATS):
+    """One task per chart.
+
+    ``('radar', label, position, player, team, fmt)`` for every season row,
+    ``('funnel', team1, team2, stat, fmt)`` for every pair of teams.
+    """
+    players = season_metrics(['Player', 'Team', 'Pos.'], path)
+    # By row label: two players at a position can share a name
+    tasks = [('radar', label, pos, player, team, fmt)
+             for label, pos, player, team in zip(players.index, players['Pos.'], players['Player'], players['Team'])
+             for fmt in formats]
+    teams = sorted(team_table(path).index)
+    tasks += [('funnel', t1, t2, stat, fmt)
+              for t1, t2 in itertools.combinations(teams, 2) for stat in funnel_stats for fmt in formats]
+    return tasks
+
+
+def _init_worker(path):
+    global _path
+    _path = path
+    # Every chart is drawn once, so keeping the bytes around would only grow the worker
+    chart_cache().max_bytes = 0
+
+
+def render_task(task, path=None):
+    """``(archive name, bytes)`` of one chart task."""
+    path = path or _path
+    if task[0] == 'radar':
+        _, label, position, player, team, fmt = task
+        data = charts.player_vs_average(position, player, path=path, fmt=fmt, label=label)
+        return f'players/{safe_name(position)}/{safe_name(player)} ({safe_name(team)}).{fmt}', data
+    _, team1, team2, stat, fmt = task
+    data = charts.funnel(team1, team2, stat, path=path, fmt=fmt)
+    return f'funnels/{safe_name(team1)} vs {safe_name(team2)}/{safe_name(stat)}.{fmt}', data
+
+
+def _results(tasks, workers, path):
+    if workers <= 1:
+        # In this process the cache may be serving pages, so give its size back afterwards
+        cache = chart_cache()
+        max_bytes = cache.max_bytes
+        try:
+            _init_worker(path)
+            yield from map(render_task, tasks)
+        finally:
+            cache.max_bytes = max_bytes
+        return
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with multiprocessing.Pool(workers, _init_worker, (path,)) as pool:
+        yield from pool.imap_unordered(render_task, tasks, chunksize)
+
+
+def generate(out, path=SEASON_FILE, workers=None, formats=('png',), funnel_stats=DEFAULT_FUNNEL_STATS,
+             progress=None):
+    """Write the scouting archive to ``out`` and return its manifest.
+
+    ``progress(done, total, elapsed seconds)`` is called after every chart.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    # Load (or map) the season and build the indexes once; forked workers inherit them
+    tables = summary_tables(path)
+    tasks = chart_tasks(path, formats, funnel_stats)
+    positional_averages(RADAR_COLUMNS, path)
+    if funnel_stats:
+        matchup_matrix(path)
+    # Drawing the first chart of each kind here imports matplotlib and builds
+    # the figure templates once, instead of in every worker
+    first = [next(t for t in tasks if t[0] == kind) for kind in ('radar', 'funnel') if any(t[0] == kind for t in tasks)]
+    rest = [t for t in tasks if t not in first]
+    tmp = f'{out}.{os.getpid()}.tmp'
+    try:
+        with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for name, df in tables.items():
+                archive.writestr(name, df.to_csv(index=False))
+            render_start = time.perf_counter()
+            results = itertools.chain([render_task(t, path) for t in first], _results(rest, workers, path))
+            for done, (name, data) in enumerate(results, 1):
+                # PNG and PDF are compressed already
+                archive.writestr(name, data, compress_type=zipfile.ZIP_STORED)
+                if progress:
+                    progress(done, len(tasks), time.perf_counter() - start)
+            manifest = {
+                'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+                'season_file': path,
+                'version': season_cache(path).version,
+                'workers': workers,
+                'formats': list(formats),
+                'funnel_stats': list(funnel_stats),
+                'players': sum(t[0] == 'radar' for t in tasks) // len(formats),
+                'funnels': sum(t[0] == 'funnel' for t in tasks) // len(formats),
+                'charts': len(tasks),
+                'render_s': time.perf_counter() - render_start,
+                'total_s': time.perf_counter() - start,
+            }
+            archive.writestr('manifest.json', json.dumps(manifest, indent=2))
+        os.replace(tmp, out)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate scouting reports for every player and team into one zip.')
+    parser.add_argument('out', help='zip archive to write')
+    parser.add_argument('--season', default=SEASON_FILE, help='season CSV file')
+    parser.add_argument('--workers', type=int, help='rendering processes (default: one per core)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['png'], help='chart file formats')
+    parser.add_argument('--funnel-stats', nargs='*', choices=FUNNEL_STATS, default=DEFAULT_FUNNEL_STATS,
+                        help='funnel statistics drawn for every team pair (none to skip funnels)')
+    args = parser.parse_args(argv)
+
+    shown = [0.0]
+
+    def progress(done, total, elapsed):
+        # At most a few updates a second; the last one always
+        if done < total and elapsed - shown[0] < PROGRESS_INTERVAL:
+            return
+        shown[0] = elapsed
+        left = elapsed / done * (total - done)
+        end = '\n' if done == total else ''
+        print(f'\r{done:>6}/{total} charts  {elapsed:7.1f} s elapsed  ~{left:6.1f} s left', end=end,
+              file=sys.stderr, flush=True)
+
+    manifest = generate(args.out, args.season, args.workers, args.formats, args.funnel_stats, progress)
+    print(f"{args.out}: {manifest['players']} players, {manifest['funnels']} funnels, "
+          f"{manifest['charts']} charts in {manifest['total_s']:.1f} s on {manifest['workers']} workers")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""Prepared season tables, published once and memory-mapped by every server process.
+
+Every Streamlit replica used to read the snapshot and build its own cleaned
+season table (``prepare_season``) and team table, so memory grew with the
+number of workers. The cleaned tables are now published as immutable
+Arrow files, one directory per version of the source file::
+
+    data/shared/2023stats/<source sha1>/season.arrow
+                                        teams.arrow
+    data/shared/2023stats/CURRENT       sha1 of the version last published
+
+Each process maps the files instead of copying them. The OS page cache
+holds one copy shared by every worker, so adding workers adds almost no
+memory. The files are written uncompressed, and float NaNs are stored as
+values rather than Arrow nulls. Numeric and categorical columns therefore
+come back as read-only views of the mapping. Only the Player names
+(Python strings) are copied into each process.
+
+A version is written to a temporary directory and renamed into place, so
+readers see it either complete or not at all, and it is never changed
+afterwards. When a new report lands, the first process to notice the new
+source digest publishes its version and the others attach to it. A rerun
+already holding the old tables keeps reading them: files are unlinked
+when old versions are pruned, never rewritten, so existing mappings stay
+valid.
+
+    python -m omfo.shared publish [data/2023stats.csv]
+    python -m omfo.shared status
+"""
+import argparse
+import os
+import shutil
+import sys
+from collections import namedtuple
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from omfo.data import DATA_DIR, SEASON_FILE, file_digest, prepare_season, read_season_csv
+
+SHARED_DIR = os.path.join(DATA_DIR, 'shared')
+CURRENT = 'CURRENT'
+# Versions kept per source file (the current one is never pruned)
+KEEP_VERSIONS = 3
+
+SharedSeason = namedtuple('SharedSeason', ['version', 'season', 'teams'])
+
+
+def shared_root(csv_path, root=SHARED_DIR):
+    from omfo.snapshot import _snapshot_stem
+    return os.path.join(root, os.path.basename(_snapshot_stem(csv_path)))
+
+
+def version_dir(csv_path, version, root=SHARED_DIR):
+    return os.path.join(shared_root(csv_path, root), version)
+
+
+def _to_table(df, preserve_index=False):
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    # from_pandas turns NaN into nulls, and reading nulls back means filling a copy
+    for i, field in enumerate(table.schema):
+        if pa.types.is_floating(field.type) and field.name in df.columns:
+            table = table.set_column(i, field, pa.array(df[field.name].to_numpy(), type=field.type, from_pandas=False))
+    return table
+
+
+def _write_version(target, season, teams):
+    tmp = f'{target}.{os.getpid()}.tmp'
+    os.makedirs(tmp, exist_ok=True)
+    feather.write_feather(_to_table(season), os.path.join(tmp, 'season.arrow'), compression='uncompressed')
+    feather.write_feather(_to_table(teams, preserve_index=True), os.path.join(tmp, 'teams.arrow'),
+                          compression='uncompressed')
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        # Another process published the same version first
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isdir(target):
+            raise
+
+
+def current_version(csv_path, root=SHARED_DIR):
+    """Version last published for ``csv_path``, or ``None``."""
+    try:
+        with open(os.path.join(shared_root(csv_path, root), CURRENT)) as fh:
+            return fh.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def set_current(csv_path, version, root=SHARED_DIR):
+    path = os.path.join(shared_root(csv_path, root), CURRENT)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as fh:
+        fh.write(version + '\n')
+    os.replace(tmp, path)
+
+
+def versions(csv_path, root=SHARED_DIR):
+    """Published versions of ``csv_path``, oldest first."""
+    base = shared_root(csv_path, root)
+    try:
+        names = [n for n in os.listdir(base) if not n.endswith('.tmp') and os.path.isdir(os.path.join(base, n))]
+    except FileNotFoundError:
+        return []
+    return sorted(names, key=lambda n: os.stat(os.path.join(base, n)).st_mtime_ns)
+
+
+def prune(csv_path, keep=KEEP_VERSIONS, root=SHARED_DIR):
+    """Remove all but the newest ``keep`` versions (and never the current one)."""
+    current = current_version(csv_path, root)
+    old = [v for v in versions(csv_path, root) if v != current]
+    for version in old[:max(0, len(old) - (keep - 1))]:
+        shutil.rmtree(version_dir(csv_path, version, root), ignore_errors=True)
+
+
+def publish(csv_path=SEASON_FILE, digest=None, root=SHARED_DIR, keep=KEEP_VERSIONS, source=None, current=True):
+    """Publish the cleaned tables of ``csv_path`` (if not already there) and make them current.
+
+    ``source`` is a file holding the content to publish when it isn't at
+    ``csv_path`` yet (a refresh stages the next report first); pass
+    ``current=False`` to publish without moving ``CURRENT``.
+    """
+    from omfo.metrics import add_derived_metrics
+    from omfo.snapshot import load_snapshot
+    from omfo.teams import team_context
+
+    source = source or csv_path
+    digest = digest or file_digest(source)
+    target = version_dir(csv_path, digest, root)
+    if not os.path.isdir(target):
+        os.makedirs(shared_root(csv_path, root), exist_ok=True)
+        if source == csv_path:
+            raw = load_snapshot(csv_path, digest)
+        else:
+            raw = add_derived_metrics(read_season_csv(source))
+        season = prepare_season(raw)
+        _write_version(target, season, team_context(season))
+    if current:
+        set_current(csv_path, digest, root)
+    prune(csv_path, keep, root)
+    return target
+
+
+def _map(path):
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def attach(csv_path, version, root=SHARED_DIR):
+    """Memory-mapped ``SharedSeason`` of a published version, or ``None`` if it isn't published."""
+    target = version_dir(csv_path, version, root)
+    try:
+        return SharedSeason(version, _map(os.path.join(target, 'season.arrow')),
+                            _map(os.path.join(target, 'teams.arrow')))
+    except (FileNotFoundError, pa.ArrowInvalid):
+        return None
+
+
+def attach_or_publish(csv_path, digest, root=SHARED_DIR, source=None):
+    """Attach the version of ``csv_path`` with ``digest``, publishing it first if needed.
+
+    A version published from a staged ``source`` doesn't become current.
+    Returns ``None`` when it can be neither attached nor written (a
+    read-only deploy), so the caller falls back to a private copy.
+    """
+    shared = attach(csv_path, digest, root)
+    if shared is None:
+        try:
+            publish(csv_path, digest, root, source=source, current=source in (None, csv_path))
+        except OSError:
+            return None
+        shared = attach(csv_path, digest, root)
+    return shared
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Publish the cleaned season tables for memory-mapped sharing.')
+    parser.add_argument('--root', default=SHARED_DIR)
+    commands = parser.add_subparsers(dest='command', required=True)
+    publish_cmd = commands.add_parser('publish', help='publish a season file and make it current')
+    publish_cmd.add_argument('csv', nargs='?', default=SEASON_FILE)
+    publish_cmd.add_argument('--keep', type=int, default=KEEP_VERSIONS, help='versions to keep')
+    status_cmd = commands.add_parser('status', help='list the published versions')
+    status_cmd.add_argument('csv', nargs='?', default=SEASON_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == 'publish':
+        print(publish(args.csv, root=args.root, keep=args.keep))
+        return 0
+    current = current_version(args.csv, args.root)
+    for version in versions(args.csv, args.root):
+        target = version_dir(args.csv, version, args.root)
+        size = sum(os.path.getsize(os.path.join(target, n)) for n in os.listdir(target))
+        print(f"{'*' if version == current else ' '} {version}  {size / 2 ** 20:6.2f} MiB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+"""Columnar snapshots of a season file with the derived metrics baked in.
+
+A snapshot is an uncompressed Feather (Arrow IPC) file written next to the
+source CSV, e.g. ``data/2023stats.feather``. It stores the raw columns plus
+``metrics.DERIVED_COLUMNS`` and the SHA-1 of the CSV it was built from, so
+a stale snapshot is detected and rebuilt instead of served. The team table
+(``teams.team_context`` of the cleaned season) goes into a companion
+``<name>.teams.feather`` file tagged the same way.
+
+Rebuild from the command line with::
+
+    python -m omfo.snapshot               # every stale snapshot under data/
+    python -m omfo.snapshot --force data/2023stats.csv
+    python -m omfo.snapshot data/2023stats.numbers       # Numbers exports read natively
+"""
+import argparse
+import glob
+import os
+import sys
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from omfo.data import DATA_DIR, file_digest, prepare_season, read_season_csv
+from omfo.metrics import DERIVED_COLUMNS, add_derived_metrics
+from omfo.schema import SCHEMA_VERSION
+
+SOURCE_DIGEST_KEY = b'omfo.source_sha1'
+SCHEMA_VERSION_KEY = b'omfo.schema'
+
+
+def _snapshot_stem(csv_path):
+    # 2023stats.csv -> 2023stats; a Numbers export keeps its extension so it
+    # cannot collide with the CSV of the same name (2023stats.numbers)
+    stem, ext = os.path.splitext(csv_path)
+    return stem if ext == '.csv' else csv_path
+
+
+def snapshot_path(csv_path):
+    return _snapshot_stem(csv_path) + '.feather'
+
+
+def team_snapshot_path(csv_path):
+    return _snapshot_stem(csv_path) + '.teams.feather'
+
+
+def _snapshot_source(snapshot):
+    stem = os.path.splitext(snapshot)[0]
+    return stem if os.path.splitext(stem)[1] else stem + '.csv'
+
+
+def _write_feather(df, out, digest, preserve_index=False):
+    table = pa.Table.from_pandas(df, preserve_index=preserve_index)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), SOURCE_DIGEST_KEY: digest.encode(),
+                                           SCHEMA_VERSION_KEY: SCHEMA_VERSION.encode()})
+    tmp = f'{out}.{os.getpid()}.tmp'
+    # Uncompressed so readers can memory-map the columns instead of decoding them
+    feather.write_feather(table, tmp, compression='uncompressed')
+    os.replace(tmp, out)
+
+
+def _source_digest(path, schema=None):
+    if schema is None:
+        try:
+            with pa.memory_map(path) as source:
+                schema = pa.ipc.open_file(source).schema
+        except (OSError, pa.ArrowInvalid):
+            return None
+    metadata = schema.metadata or {}
+    # Snapshots written with other column types are rebuilt, not served
+    if metadata.get(SCHEMA_VERSION_KEY) != SCHEMA_VERSION.encode():
+        return None
+    digest = metadata.get(SOURCE_DIGEST_KEY)
+    return digest.decode() if digest else None
+
+
+def snapshot_digest(path):
+    """SHA-1 of the CSV a snapshot was built from, or ``None`` if there is no usable snapshot.
+
+    A snapshot missing any registered metric, or written under another
+    ``schema.SCHEMA_VERSION``, counts as unusable and is rebuilt.
+    """
+    try:
+        with pa.memory_map(path) as source:
+            schema = pa.ipc.open_file(source).schema
+    except (OSError, pa.ArrowInvalid):
+        return None
+    if not set(DERIVED_COLUMNS) <= set(schema.names):
+        return None
+    return _source_digest(path, schema)
+
+
+def build_snapshot(csv_path, digest=None):
+    """Parse ``csv_path``, add the derived metrics and write the snapshots. Returns the player frame."""
+    from omfo.teams import team_context
+
+    digest = digest or file_digest(csv_path)
+    df = add_derived_metrics(read_season_csv(csv_path))
+    _write_feather(team_context(prepare_season(df)), team_snapshot_path(csv_path), digest, preserve_index=True)
+    _write_feather(df, snapshot_path(csv_path), digest)
+    return df
+
+
+def read_snapshot(path):
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def load_snapshot(csv_path, digest=None):
+    """Season table with derived metrics, from the snapshot when it matches ``csv_path``.
+
+    A missing or stale snapshot is rebuilt. If it can't be written (read-only
+    deploy), the metrics are computed in memory instead.
+    """
+    digest = digest or file_digest(csv_path)
+    path = snapshot_path(csv_path)
+    if snapshot_digest(path) == digest:
+        return read_snapshot(path)
+    try:
+        return build_snapshot(csv_path, digest)
+    except OSError:
+        return add_derived_metrics(read_season_csv(csv_path))
+
+
+def load_team_snapshot(csv_path, digest):
+    """Team table stored with the snapshot of ``csv_path``, or ``None`` if it is missing or stale."""
+    path = team_snapshot_path(csv_path)
+    if digest is None or _source_digest(path) != digest:
+        return None
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build columnar snapshots of the season CSV files.')
+    parser.add_argument('csv', nargs='*', help='season CSV files (default: every CSV with a snapshot or 2023stats.csv)')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the snapshot is up to date')
+    args = parser.parse_args(argv)
+
+    snapshots = [p for p in glob.glob(os.path.join(DATA_DIR, '*.feather')) if not p.endswith('.teams.feather')]
+    paths = args.csv or sorted({os.path.join(DATA_DIR, '2023stats.csv'),
+                                *(_snapshot_source(p) for p in snapshots)})
+    for csv_path in paths:
+        digest = file_digest(csv_path)
+        if (not args.force and snapshot_digest(snapshot_path(csv_path)) == digest
+                and _source_digest(team_snapshot_path(csv_path)) == digest):
+            print(f'{csv_path}: up to date')
+            continue
+        df = build_snapshot(csv_path, digest)
+        print(f'{csv_path}: wrote {snapshot_path(csv_path)} ({len(df)} rows)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Date-partitioned history of daily stat reports.
+
+Each daily report is stored once, as its own partition::
+
+    data/store/season=2023/date=2023-08-03.feather
+
+A partition holds the report's table with the derived metrics added, tagged
+with the report name and the SHA-1 of the source file. New days are new
+files; existing partitions are never rewritten. Reports are cumulative, so
+"as of" a date means the latest partition on or before it. The partition
+list comes from file names alone (no file is opened to answer it) and is
+re-scanned only when the store directory changes.
+
+Command line::
+
+    python -m omfo.store ingest data/2023stats.csv [--season 2023]
+    python -m omfo.store ingest data/2023stats.numbers
+    python -m omfo.store list
+"""
+import argparse
+import bisect
+import datetime
+import os
+import re
+import sys
+import threading
+import zipfile
+
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from omfo.data import DATA_DIR, file_digest, read_season_csv
+from omfo.metrics import add_derived_metrics
+from omfo.numbers import report_name
+
+STORE_DIR = os.path.join(DATA_DIR, 'store')
+
+REPORT_NAME_KEY = b'omfo.report_name'
+SOURCE_DIGEST_KEY = b'omfo.source_sha1'
+
+_REPORT_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_PARTITION = re.compile(r'^date=(\d{4}-\d{2}-\d{2})\.feather$')
+
+
+def read_report_header(path):
+    """Report name and date from the first line of a daily report.
+
+    ``Daily_2K_Player_Stats_Report_2023-08-03[29],,,`` gives
+    ``('Daily_2K_Player_Stats_Report_2023-08-03[29]', date(2023, 8, 3))``.
+    """
+    if zipfile.is_zipfile(path):
+        name = report_name(path)
+    else:
+        with open(path, encoding='utf-8-sig') as fh:
+            name = fh.readline().split(',')[0].strip()
+    match = _REPORT_DATE.search(name)
+    if match is None:
+        raise ValueError(f'{path}: no report date in header {name!r}')
+    return name, datetime.date.fromisoformat(match.group(1))
+
+
+def season_for(date):
+    """League seasons run inside a calendar year (Season 6 is 2023)."""
+    return str(date.year)
+
+
+def as_date(value):
+    return value if isinstance(value, datetime.date) else datetime.date.fromisoformat(str(value))
+
+
+class StatsStore:
+
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._scanned = None
+        self._partitions = []
+
+    def partition_path(self, season, date):
+        return os.path.join(self.root, f'season={season}', f'date={as_date(date).isoformat()}.feather')
+
+    def _scan(self):
+        # Directory mtimes change whenever a partition or season is added
+        try:
+            seasons = sorted(e for e in os.scandir(self.root) if e.is_dir() and e.name.startswith('season='))
+        except FileNotFoundError:
+            seasons = []
+        stamp = tuple((e.name, e.stat().st_mtime_ns) for e in seasons)
+        if stamp == self._scanned:
+            return
+        partitions = []
+        for entry in seasons:
+            season = entry.name[len('season='):]
+            for name in os.listdir(entry.path):
+                match = _PARTITION.match(name)
+                if match:
+                    partitions.append((datetime.date.fromisoformat(match.group(1)), season))
+        self._partitions = sorted(partitions)
+        self._scanned = stamp
+
+    def partitions(self, season=None):
+        """``(date, season)`` of every stored report, oldest first."""
+        with self._lock:
+            self._scan()
+            return [p for p in self._partitions if season is None or p[1] == season]
+
+    def ingest(self, path, season=None, replace=False):
+        """Add a daily report as a new partition. Returns ``(season, date)``.
+
+        Ingesting the same file again is a no-op. A different file for a
+        date that is already stored raises ``ValueError`` unless ``replace``.
+        """
+        name, date = read_report_header(path)
+        season = season or season_for(date)
+        digest = file_digest(path)
+        out = self.partition_path(season, date)
+        if os.path.exists(out) and not replace:
+            if self.metadata(season, date).get(SOURCE_DIGEST_KEY) == digest.encode():
+                return season, date
+            raise ValueError(f'{out} already holds a different {date} report')
+        self.write(season, date, add_derived_metrics(read_season_csv(path)), name, digest)
+        return season, date
+
+    def delta_path(self, season, date):
+        return os.path.join(self.root, f'season={season}', 'delta', f'date={as_date(date).isoformat()}.feather')
+
+    def write(self, season, date, df, name, digest):
+        """Write one partition atomically (readers never see a partial file)."""
+        self._write(self.partition_path(season, date), df, name, digest)
+
+    def write_delta(self, season, date, df, name, digest):
+        """Write the change table of one report (see ``omfo.ingest``)."""
+        self._write(self.delta_path(season, date), df, name, digest)
+
+    def _write(self, out, df, name, digest):
+        os.makedirs(os.path.dirname(out), exist_ok=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               REPORT_NAME_KEY: name.encode(), SOURCE_DIGEST_KEY: digest.encode()})
+        tmp = f'{out}.{os.getpid()}.tmp'
+        feather.write_feather(table, tmp, compression='uncompressed')
+        os.replace(tmp, out)
+
+    def metadata(self, season, date):
+        with pa.memory_map(self.partition_path(season, date)) as source:
+            return pa.ipc.open_file(source).schema.metadata or {}
+
+    def load(self, season, date, columns=None):
+        """One partition, memory-mapped."""
+        return feather.read_table(self.partition_path(season, date), columns=columns, memory_map=True).to_pandas()
+
+    def load_delta(self, season, date):
+        return feather.read_table(self.delta_path(season, date), memory_map=True).to_pandas()
+
+    def latest(self, as_of=None, season=None):
+        """``(date, season)`` of the newest report on or before ``as_of`` (default: newest overall)."""
+        partitions = self.partitions(season)
+        if as_of is None:
+            return partitions[-1] if partitions else None
+        i = bisect.bisect_right([date for date, _ in partitions], as_date(as_of))
+        return partitions[i - 1] if i else None
+
+    def as_of(self, date=None, season=None, columns=None):
+        """The cumulative table as it stood on ``date``, or ``None`` if nothing was reported yet."""
+        found = self.latest(date, season)
+        return None if found is None else self.load(found[1], found[0], columns)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Manage the date-partitioned stats store.')
+    parser.add_argument('--root', default=STORE_DIR, help='store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+    ingest = commands.add_parser('ingest', help='add daily report files (CSV or Numbers)')
+    ingest.add_argument('reports', nargs='+')
+    ingest.add_argument('--season', help='season label (default: year of the report date)')
+    ingest.add_argument('--replace', action='store_true', help='overwrite a stored report for the same date')
+    commands.add_parser('list', help='list stored reports')
+    args = parser.parse_args(argv)
+
+    store = StatsStore(args.root)
+    if args.command == 'ingest':
+        for report in args.reports:
+            season, date = store.ingest(report, args.season, args.replace)
+            print(f'{report}: season={season} date={date}')
+    else:
+        for date, season in store.partitions():
+            print(f'season={season} date={date}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Synthetic leagues with the schema of a daily report.
+
+``synthetic_league`` draws a season table of any size with the columns,
+dtypes and internal consistency of ``data/2023stats.csv``: made shots never
+exceed attempts, rebounds add up and points follow from the makes. It is
+meant for benchmarks and load tests, not for modelling players.
+
+    python -m omfo.synthetic 5000 data/synthetic.csv
+"""
+import argparse
+import datetime
+import sys
+
+import numpy as np
+import pandas as pd
+
+from omfo.schema import apply_schema
+
+# Position mix of the 2023 season
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C', 'PF/C', 'SF/PF', 'SF/C']
+POSITION_WEIGHTS = [0.19, 0.19, 0.19, 0.19, 0.19, 0.02, 0.02, 0.01]
+
+REPORT_NAME = 'Daily_2K_Player_Stats_Report_{date}[0]'
+
+
+def _made(rng, attempts, rate):
+    made = rng.binomial(attempts, rate)
+    pct = np.divide(made, attempts, out=np.zeros(len(made)), where=attempts > 0).round(3)
+    return made, pct
+
+
+def synthetic_league(n_players, n_teams=None, seed=0):
+    """A typed season table of ``n_players`` rows spread over ``n_teams`` teams.
+
+    Teams default to one per five players, capped at 30 (larger tables are
+    read as many seasons of the same franchises).
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = n_teams or min(30, max(2, n_players // 5))
+    gp = rng.integers(1, 41, n_players)
+
+    fga = rng.poisson(gp * 8)
+    fg3a = rng.binomial(fga, 0.5)
+    fg3m, fg3_pct = _made(rng, fg3a, 0.36)
+    # Two-point makes on top of the threes
+    fg2m = rng.binomial(fga - fg3a, 0.55)
+    fgm = fg2m + fg3m
+    fg_pct = np.divide(fgm, fga, out=np.zeros(n_players), where=fga > 0).round(3)
+    fta = rng.poisson(gp * 1.5)
+    ftm, ft_pct = _made(rng, fta, 0.8)
+    oreb = rng.poisson(gp * 0.6)
+    dreb = rng.poisson(gp * 3)
+
+    raw = pd.DataFrame({
+        'Person_id': 1600000 + np.arange(n_players),
+        'Player': [f'Player {i:06d}' for i in range(n_players)],
+        'Team': [f'Team {t:02d}' for t in rng.integers(0, n_teams, n_players)],
+        'GP': gp,
+        'Min': gp * 24,
+        'FGM': fgm,
+        'FGA': fga,
+        'FG%': fg_pct,
+        'FG3M': fg3m,
+        'FG3A': fg3a,
+        'FG3%': fg3_pct,
+        'FTM': ftm,
+        'FTA': fta,
+        'FT%': ft_pct,
+        'OREB': oreb,
+        'DREB': dreb,
+        'REB': oreb + dreb,
+        'AST': rng.poisson(gp * 4),
+        'PF': rng.poisson(gp * 1.8),
+        'STL': rng.poisson(gp * 1.2),
+        'TOV': rng.poisson(gp * 2) + 1,
+        'BLK': rng.poisson(gp * 0.4),
+        'PTS': 2 * fgm + fg3m + ftm,
+        'Pos.': rng.choice(POSITIONS, n_players, p=POSITION_WEIGHTS),
+    })
+    return apply_schema(raw, 'synthetic league')
+
+
+def write_report(df, path, date=None):
+    """Write ``df`` as a daily report CSV (report name and date on the first line)."""
+    date = date or datetime.date.today()
+    with open(path, 'w', newline='') as fh:
+        fh.write(REPORT_NAME.format(date=date.isoformat()) + ',' * (len(df.columns) - 1) + '\n')
+        df.to_csv(fh, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Write a synthetic daily report.')
+    parser.add_argument('players', type=int, help='number of player rows')
+    parser.add_argument('out', help='output CSV path')
+    parser.add_argument('--teams', type=int, help='number of teams (default: players / 5, at most 30)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--date', type=datetime.date.fromisoformat, help='report date (default: today)')
+    args = parser.parse_args(argv)
+    write_report(synthetic_league(args.players, args.teams, args.seed), args.out, args.date)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
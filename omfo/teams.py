@@ -0,0 +1,74 @@
+"""Team-level aggregates.
+
+``team_context`` builds every team total and team rate in one grouped
+pass. Player rows pick up their team's values with ``Series.map`` on the
+team key (index alignment, no merge of the player table). The season's
+table is written next to the player snapshot and cached per file version,
+so the Team Matchups page only looks teams up by name.
+"""
+import numpy as np
+import pandas as pd
+
+from omfo.data import PERCENTAGE_COLUMNS, SEASON_FILE, derived, season_cache
+from omfo.profiling import timed
+
+# Counting stats that add up to a team total
+TEAM_TOTAL_COLUMNS = ['GP', 'Min', 'FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA', 'OREB', 'DREB', 'REB', 'AST', 'PF',
+                      'STL', 'TOV', 'BLK', 'PTS']
+
+player_min = 24
+
+
+def team_context(df):
+    """One row per team: player count, summed box score and the team ratios."""
+    columns = [col for col in TEAM_TOTAL_COLUMNS if col in df.columns]
+    grouped = df.groupby('Team', observed=True)
+    teams = grouped[columns].sum()
+    # Counts are stored as int16 per player; team totals get the full width
+    teams = teams.astype({col: 'int64' for col in columns if pd.api.types.is_integer_dtype(teams[col])})
+    teams.insert(0, 'Players', grouped.size())
+    # Shooting splits are averaged over the roster, as on the Team Matchups page
+    pct_columns = [col for col in PERCENTAGE_COLUMNS if col in df.columns]
+    teams[pct_columns] = grouped[pct_columns].mean()
+
+    # Ratio of assists to made field goals for each team
+    teams['TmAst_TmFGM'] = teams['AST'] / teams['FGM']
+    # Team's average assists per minute (TmAst/(TmMin/5))
+    teams['Tm_Avg_Ast_Per_Min'] = teams['AST'] / (teams['Players'] * player_min)
+    return teams
+
+
+def broadcast(teams, team, column):
+    """``column`` of the team table for every player whose team is in ``team``."""
+    values = teams[column]
+    if isinstance(team.dtype, pd.CategoricalDtype):
+        # One lookup per category, spread over the rows by category code (-1, a
+        # missing team, picks the trailing NaN)
+        by_code = np.append(values.reindex(team.cat.categories).to_numpy(dtype='float64'), np.nan)
+        return pd.Series(by_code[team.cat.codes.to_numpy()], index=team.index, name=team.name)
+    return team.map(values)
+
+
+def team_summary(teams, team):
+    """The "Total" row the Team Matchups page shows for ``team``."""
+    columns = [col for col in TEAM_TOTAL_COLUMNS + PERCENTAGE_COLUMNS if col in teams.columns]
+    total = teams.loc[[team], columns].reset_index(drop=True)
+    total.insert(0, 'Player', 'Total')
+    total.insert(1, 'Team', team)
+    total.insert(2, 'Pos', '')
+    return total
+
+
+def _load_team_table(season, path):
+    from omfo.snapshot import load_team_snapshot
+    shared = season_cache(path).shared
+    if shared is not None:
+        return shared.teams
+    teams = load_team_snapshot(path, season_cache(path).version)
+    return team_context(season) if teams is None else teams
+
+
+@timed('data load')
+def team_table(path=SEASON_FILE):
+    """Team table of the cleaned season, read from the snapshot when it is current."""
+    return derived('team_table', lambda season: _load_team_table(season, path), path)
@@ -0,0 +1,167 @@
+"""Fill the process-wide caches before a server takes traffic.
+
+Without a warm-up, the first visitor to each page after a deploy pays for
+reading the snapshot, building the indexes and drawing the charts. ``run``
+does that work once, in the server process, in the order the pages need it:
+
+1. the season snapshot (the CSV is only parsed if no current snapshot exists),
+2. the column sets each page reads, and the Careless Index leaderboards,
+3. the percentile index and positional averages behind the radars,
+4. the team table and the all-pairs funnel matrix,
+5. radar charts for the likeliest picks: the top players by Eff at each position,
+6. the funnel for the Team Matchups default pair, for every statistic.
+
+The charts go into the shared chart cache, keyed the way ``omfo.charts``
+keys them for the pages. ``serve.py`` runs the warm-up and then starts the
+app in the same process. To time a warm-up on its own::
+
+    python -m omfo.warmup --radars 3 --out warmup.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import sys
+import time
+
+from omfo import charts
+from omfo.averages import positional_averages
+from omfo.chart_cache import chart_cache
+from omfo.data import SEASON_FILE, season_cache
+from omfo.matchups import FUNNEL_STATS, matchup_matrix
+from omfo.metrics import SEASON_COLUMNS, season_metrics
+from omfo.percentiles import RADAR_COLUMNS, percentile_index
+from omfo.rankings import leaderboards
+from omfo.teams import team_table
+
+logger = logging.getLogger('omfo.warmup')
+
+# Radars pre-rendered per position
+POPULAR_RADARS = 3
+# Team Matchups opens on this pair
+DEFAULT_FUNNEL = ('76ers GC', 'Raptors Uprising GC')
+
+# Column sets the pages ask ``season_metrics`` for
+PAGE_COLUMNS = [
+    SEASON_COLUMNS,
+    SEASON_COLUMNS + ['Eff'],
+    ['Player', 'Team', 'Pos.'] + RADAR_COLUMNS,
+    ['Player', 'Pos.', 'AST', 'TOV', 'Careless Index'],
+]
+
+_last_report = None
+
+
+def popular_players(n, path=SEASON_FILE):
+    """``(position, player)`` for the top ``n`` players by Eff at each position."""
+    df = season_metrics(['Player', 'Pos.', 'Eff'], path)
+    top = df.sort_values('Eff', ascending=False, kind='stable').groupby('Pos.', observed=True).head(n)
+    return list(zip(top['Pos.'], top['Player']))
+
+
+def _season(path):
+    return f'{len(season_cache(path).season())} rows'
+
+
+def _page_tables(path):
+    for columns in PAGE_COLUMNS:
+        season_metrics(columns, path)
+    leaderboards(['Careless Index'], ascending=['Careless Index'], path=path)
+    return f'{len(PAGE_COLUMNS)} column sets'
+
+
+def _percentiles(path):
+    percentile_index(RADAR_COLUMNS, path)
+    positional_averages(RADAR_COLUMNS, path)
+    return f'{len(RADAR_COLUMNS)} stats'
+
+
+def _teams(path):
+    teams = team_table(path)
+    matchup_matrix(path)
+    return f'{len(teams)} teams'
+
+
+def _radars(path, n):
+    picks = popular_players(n, path)
+    for position, player in picks:
+        charts.player_vs_average(position, player, path=path)
+    return f'{len(picks)} charts'
+
+
+def _funnels(path, pair):
+    teams = set(team_table(path).index)
+    missing = [team for team in pair if team not in teams]
+    if missing:
+        return f'skipped: {", ".join(missing)} not in the season file'
+    for stat in FUNNEL_STATS:
+        charts.funnel(*pair, stat, path=path)
+    return f'{len(FUNNEL_STATS)} charts'
+
+
+def run(path=SEASON_FILE, radars=POPULAR_RADARS, funnel_pair=DEFAULT_FUNNEL):
+    """Warm every cache for ``path`` and return a JSON-ready readiness report.
+
+    A failing step is logged and recorded and the remaining steps still
+    run; ``ready`` is true only when every step succeeded.
+    """
+    global _last_report
+    steps = [
+        ('season snapshot', lambda: _season(path)),
+        ('page tables', lambda: _page_tables(path)),
+        ('percentile index', lambda: _percentiles(path)),
+        ('team tables', lambda: _teams(path)),
+        ('radar charts', lambda: _radars(path, radars)),
+        ('funnel charts', lambda: _funnels(path, funnel_pair)),
+    ]
+    started = datetime.datetime.now(datetime.timezone.utc)
+    start = time.perf_counter()
+    results = []
+    for name, step in steps:
+        step_start = time.perf_counter()
+        try:
+            detail, error = step(), None
+        except Exception as exc:
+            logger.exception('warm-up step %r failed', name)
+            detail, error = None, f'{type(exc).__name__}: {exc}'
+        seconds = time.perf_counter() - step_start
+        results.append({'name': name, 's': seconds, 'detail': detail, 'error': error})
+        logger.info('%-16s %7.0f ms  %s', name, seconds * 1000, error or detail)
+
+    report = {
+        'ready': all(r['error'] is None for r in results),
+        'started': started.isoformat(timespec='seconds'),
+        'duration_s': time.perf_counter() - start,
+        'path': path,
+        'version': season_cache(path).version,
+        'steps': results,
+        'chart_cache': chart_cache().stats(),
+    }
+    logger.info('warm-up %s in %.2f s', 'complete' if report['ready'] else 'finished with errors',
+                report['duration_s'])
+    _last_report = report
+    return report
+
+
+def last_report():
+    """Report of the most recent warm-up in this process (``None`` if there was none)."""
+    return _last_report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Warm the page caches and report how long it took.')
+    parser.add_argument('--season', default=SEASON_FILE, help='season CSV file')
+    parser.add_argument('--radars', type=int, default=POPULAR_RADARS, help='radar charts per position')
+    parser.add_argument('--out', help='write the report as JSON')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    report = run(args.season, args.radars)
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    return 0 if report['ready'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Streamlit side of ``omfo.profiling``: per-page timing and the opt-in panel.
+
+Each page runs its body inside ``with perf.page(name):``. The rerun is
+recorded even when it is cut short (``st.stop()``, a rerun triggered by
+a widget, an error); the panel only shows for reruns that complete.
+Open any page with ``?perf=1`` (or set ``OMFO_PERF_PANEL=1``) to see the
+rerun's section timings and the page's recent medians in the sidebar.
+Every rerun is logged either way (see ``omfo.profiling``).
+"""
+import contextlib
+import os
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from omfo import profiling
+from omfo.profiling import section
+
+
+def start_page(page):
+    ctx = get_script_run_ctx()
+    return profiling.start(page, session=ctx.session_id if ctx else None)
+
+
+def panel_enabled():
+    return os.environ.get('OMFO_PERF_PANEL') == '1' or st.query_params.get('perf') == '1'
+
+
+def dataframe(data, **kwargs):
+    """``st.dataframe``, timed as dataframe serialization."""
+    with section('dataframe serialization'):
+        return st.dataframe(data, **kwargs)
+
+
+@contextlib.contextmanager
+def page(name):
+    """Profile the rerun of page ``name`` run inside the block."""
+    profile = start_page(name)
+    try:
+        yield profile
+    except BaseException as exc:
+        # StopException, RerunException or an error: record the rerun, skip the panel
+        profile.fields['stopped'] = type(exc).__name__
+        profile.finish()
+        raise
+    finish_page(profile)
+
+
+def finish_page(profile):
+    record = profile.finish()
+    if not panel_enabled():
+        return
+    import pandas as pd  # only the panel needs it; Home otherwise never loads pandas
+
+    with st.sidebar.expander('Performance', expanded=True):
+        st.caption(f"This rerun: {record['total_s'] * 1000:.1f} ms")
+        rows = [{'Section': ('  ' * d) + n, 'ms': s * 1000} for n, s, d in profile.sections]
+        st.dataframe(pd.DataFrame(rows, columns=['Section', 'ms']), hide_index=True, use_container_width=True)
+
+        history = profiling.history(profile.page)
+        sections = pd.DataFrame([{'Section': s['name'], 'ms': s['s'] * 1000, 'rerun': i}
+                                 for i, r in enumerate(history) for s in r['sections']],
+                                columns=['Section', 'ms', 'rerun'])
+        summary = sections.groupby(['Section', 'rerun'])['ms'].sum().groupby('Section').median()
+        st.caption(f"Median over the last {len(history)} reruns "
+                   f"(total {pd.Series([r['total_s'] for r in history]).median() * 1000:.1f} ms)")
+        st.dataframe(summary.sort_values(ascending=False).rename('median ms').reset_index(),
+                     hide_index=True, use_container_width=True)
@@ -0,0 +1,63 @@
+"""Start the app with warm caches.
+
+    python serve.py [--radars N] [--ready-file PATH] [--no-warmup]
+                    [--inbox DIR | --no-inbox | --no-refresh] [streamlit run options...]
+
+Runs ``omfo.warmup`` and then starts the Streamlit server in the same
+process, so the pages find the snapshot, indexes and popular charts already
+cached and the server only starts listening once they are. The warm-up
+report is logged, and ``--ready-file`` also writes it as JSON for a deploy
+script or readiness probe; Streamlit's ``/_stcore/health`` answers once the
+server is up. Any options not listed above are passed to ``streamlit run``,
+e.g. ``python serve.py --server.port 8502``.
+
+A background refresher (``omfo.refresh``) then swaps in new reports
+dropped into the inbox, warming each version before it is served. Run
+one process per data directory with the inbox. Use ``--no-inbox`` on
+the other replicas: they follow the season file and switch over when
+it changes.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+
+from omfo import refresh, warmup
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+logger = logging.getLogger('omfo.serve')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Warm the caches, then start the OMFO app.')
+    parser.add_argument('--radars', type=int, default=warmup.POPULAR_RADARS, help='radar charts per position')
+    parser.add_argument('--ready-file', help='write the warm-up report here as JSON when it finishes')
+    parser.add_argument('--no-warmup', dest='warm', action='store_false', help='start the server cold')
+    parser.add_argument('--inbox', default=refresh.INBOX_DIR, help='directory new daily reports are dropped into')
+    parser.add_argument('--no-inbox', dest='inbox', action='store_const', const=None,
+                        help='only follow changes to the season file (replicas)')
+    parser.add_argument('--no-refresh', dest='refresh', action='store_false', help='no background refresh')
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
+    # Pages open images/ and data/ relative to the app root
+    os.chdir(ROOT)
+    if args.warm:
+        report = warmup.run(radars=args.radars)
+        if not report['ready']:
+            logger.warning('starting with a partial warm-up; failed steps fill in on first use')
+        if args.ready_file:
+            with open(args.ready_file, 'w') as fh:
+                json.dump(report, fh, indent=2)
+
+    if args.refresh:
+        refresh.Refresher(inbox=args.inbox, radars=args.radars).start()
+
+    from streamlit.web import cli
+    sys.argv = ['streamlit', 'run', os.path.join(ROOT, 'Home.py'), *streamlit_args]
+    return cli.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
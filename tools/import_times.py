@@ -0,0 +1,94 @@
+"""Import cost of each app entry point, measured in a fresh interpreter.
+
+Every entry point (Home.py, each page, radar_charts.py) is run once through
+Streamlit's AppTest in its own ``python -X importtime`` process. Streamlit
+itself is imported before the measurement starts, since every page pays for
+it. The report shows:
+
+* ``import_s``: the time spent importing modules while the script first ran.
+* ``first_run_s``: that first run's wall time.
+* The heavy libraries (numpy, pandas, scipy, matplotlib, plotly, pyarrow)
+  the script pulled in, with their cumulative import times.
+
+    python tools/import_times.py
+    python tools/import_times.py --out imports.json Home.py
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ['numpy', 'pandas', 'scipy', 'matplotlib', 'plotly', 'plotly_express', 'pyarrow']
+MARKER = '--- omfo entry point ---'
+
+_CHILD = f'''
+import json, sys, time
+import streamlit
+from streamlit.testing.v1 import AppTest
+sys.stderr.write({MARKER!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=300).run()
+print(json.dumps({{"first_run_s": time.perf_counter() - start,
+                  "exception": at.exception[0].value if at.exception else None}}))
+'''
+
+
+def entry_points():
+    pages = sorted(glob.glob(os.path.join(ROOT, 'pages', '*.py')))
+    return [os.path.join(ROOT, 'Home.py'), *pages, os.path.join(ROOT, 'radar_charts.py')]
+
+
+def parse_importtime(stderr):
+    """``(total seconds, {heavy package: cumulative seconds})`` after the marker."""
+    lines = stderr.split(MARKER, 1)[-1].splitlines()
+    total, heavy = 0, {}
+    for line in lines:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not name.startswith('  '):
+            # Top level of this import tree (nested imports are indented)
+            total += int(cumulative)
+        name = name.strip()
+        if name in HEAVY:
+            heavy[name] = int(cumulative) / 1e6
+    return total / 1e6, heavy
+
+
+def measure(path):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', _CHILD, path], cwd=ROOT, env=env,
+                          capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f'{path}: {proc.stderr[-2000:]}')
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    import_s, heavy = parse_importtime(proc.stderr)
+    return {'entry_point': os.path.relpath(path, ROOT), 'import_s': import_s, 'heavy_imports_s': heavy, **result}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure the import cost of each app entry point.')
+    parser.add_argument('paths', nargs='*', help='entry points (default: Home.py, every page and radar_charts.py)')
+    parser.add_argument('--out', help='write the results as JSON')
+    args = parser.parse_args(argv)
+
+    results = []
+    for path in [os.path.abspath(p) for p in args.paths] or entry_points():
+        r = measure(path)
+        results.append(r)
+        heavy = ', '.join(f'{k} {v * 1000:.0f} ms' for k, v in r['heavy_imports_s'].items()) or '-'
+        failed = '  (script raised: see JSON)' if r['exception'] else ''
+        print(f"{r['entry_point']:<34} imports {r['import_s'] * 1000:7.0f} ms  first run {r['first_run_s'] * 1000:7.0f} ms"
+              f"  heavy: {heavy}{failed}", flush=True)
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(results, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Headless rerun latency of every page, driven through Streamlit's AppTest.
+
+Each scenario loads a page and replays the widget changes a visitor makes
+(a position and two players in the Value Finder, switching teams in Team
+Matchups, toggling Helio Grade and Careless Index, ...). Every step is one
+script rerun. It is timed with the wall clock, and its peak Python heap
+(tracemalloc; ``--no-heap`` for timing without its overhead) is recorded
+with the process's max RSS. A page's first load in the process includes
+imports and cache builds, so it is reported apart from the repeats.
+
+    python tools/page_latency.py
+    python tools/page_latency.py --repeats 5 --out latency.json --pages "Player Value Finder"
+
+Lives outside ``omfo`` because it needs Streamlit.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _page(name):
+    return os.path.join(ROOT, name)
+
+
+def _sidebar_select(key, value):
+    return lambda at: at.multiselect(key=key).set_value(value)
+
+
+def _select(index, value):
+    return lambda at: at.selectbox[index].set_value(value)
+
+
+def _multiselect(index, value):
+    return lambda at: at.sidebar.multiselect[index].set_value(value)
+
+
+# (page, scenario, [(step name, widget change)]); each step is followed by a rerun
+SCENARIOS = [
+    ('Home.py', 'load', []),
+    ('pages/1 Roster Comparison.py', 'pick team', [
+        ('team 76ers GC', _multiselect(1, ['76ers GC'])),
+        ('positions PG, SG', _multiselect(0, ['PG', 'SG'])),
+    ]),
+    ('pages/2 Player Tendencies.py', 'toggle statistic', [
+        ('Careless Index', _select(1, 'Careless Index')),
+        ('SF/PF', _select(0, 'SF/PF')),
+        ('Helio Grade', _select(1, 'Helio Grade')),
+        ('PG/SG/C', _select(0, 'PG/SG/C')),
+    ]),
+    ('pages/3 Player Value Finder.py', 'compare two players', [
+        ('position PG', _sidebar_select('pos', ['PG'])),
+        ('player 1', lambda at: at.multiselect(key='p1').set_value(at.multiselect(key='p1').options[:1])),
+        ('player 2', lambda at: at.multiselect(key='p2').set_value(at.multiselect(key='p2').options[-1:])),
+    ]),
+    ('pages/4 Team Matchups.py', 'switch teams', [
+        ('team 1 Bucks Gaming', _sidebar_select('team1', ['Bucks Gaming'])),
+        ('team 2 Knicks Gaming', _sidebar_select('team2', ['Knicks Gaming'])),
+        ('funnel AST/G', _select(0, 'AST/G')),
+    ]),
+]
+
+
+def _measure(action):
+    """``(seconds, peak heap MiB)`` of one call."""
+    if not tracemalloc.is_tracing():
+        start = time.perf_counter()
+        action()
+        return time.perf_counter() - start, None
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    action()
+    elapsed = time.perf_counter() - start
+    return elapsed, tracemalloc.get_traced_memory()[1] / 2 ** 20
+
+
+def _max_rss_mib():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return rss / 2 ** 20 if sys.platform == 'darwin' else rss / 2 ** 10
+
+
+def run_scenario(page, steps, timeout):
+    """Time loading ``page`` and then each step; raises if the page shows an exception."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(_page(page), default_timeout=timeout)
+    timings = [('load', *_measure(at.run))]
+    for name, change in steps:
+        change(at)
+        timings.append((name, *_measure(at.run)))
+        if at.exception:
+            break
+    if at.exception:
+        raise RuntimeError(f'{page}: {at.exception[0].value}')
+    return timings
+
+
+def run(pages=None, repeats=3, timeout=120, heap=True, progress=None):
+    """Latency results as a JSON-ready dict."""
+    import streamlit
+
+    os.chdir(ROOT)  # pages open images/ and data/ relative to the app root
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    if heap:
+        tracemalloc.start()
+    results = []
+    for page, scenario, steps in SCENARIOS:
+        if pages and not any(p in page for p in pages):
+            continue
+        first = run_scenario(page, steps, timeout)
+        runs = [run_scenario(page, steps, timeout) for _ in range(repeats)]
+        for i, (step, cold_s, cold_mib) in enumerate(first):
+            times = [r[i][1] for r in runs] or [cold_s]
+            peaks = [r[i][2] for r in runs] or [cold_mib]
+            results.append({
+                'page': page,
+                'scenario': scenario,
+                'step': step,
+                'first_s': cold_s,
+                'median_s': statistics.median(times),
+                'min_s': min(times),
+                'peak_heap_mib': max(peaks) if heap else None,
+                'first_peak_heap_mib': cold_mib,
+            })
+            if progress:
+                progress(results[-1])
+    if heap:
+        tracemalloc.stop()
+    return {
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'repeats': repeats,
+        'max_rss_mib': _max_rss_mib(),
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure page rerun latency headlessly.')
+    parser.add_argument('--pages', nargs='+', help='only pages whose file name contains one of these')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=120, help='seconds allowed per rerun')
+    parser.add_argument('--no-heap', dest='heap', action='store_false',
+                        help='skip tracemalloc (it slows reruns down; use for timing only)')
+    parser.add_argument('--out', help='write the results as JSON')
+    args = parser.parse_args(argv)
+
+    def progress(r):
+        heap = f"  peak heap {r['peak_heap_mib']:6.1f} MiB" if r['peak_heap_mib'] is not None else ''
+        print(f"{os.path.basename(r['page']):<28} {r['step']:<22} first {r['first_s'] * 1000:8.1f} ms  "
+              f"median {r['median_s'] * 1000:8.1f} ms{heap}", flush=True)
+
+    report = run(args.pages, args.repeats, args.timeout, args.heap, progress)
+    print(f"max RSS {report['max_rss_mib']:.0f} MiB")
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())